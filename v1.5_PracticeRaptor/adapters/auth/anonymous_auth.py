@@ -1,7 +1,6 @@
 """Anonymous authentication provider for CLI."""
-from datetime import datetime
 from typing import Any
-from uuid import uuid4
+from secrets import token_hex
 
 from core.domain.models import User
 from core.domain.enums import Language
@@ -24,19 +23,21 @@ class AnonymousAuthProvider:
         Args:
             user_id: Fixed user ID. If None, generates a new one.
         """
-        self._user_id = user_id or f"local_{uuid4().hex[:8]}"
+        self._user_id = user_id or f"local_{token_hex(4)}"
         self._user: User | None = None
+        # Ok is immutable, so one instance is shared by every call
+        self._cached_ok: Ok[User] | None = None
 
     def get_current_user(self) -> Result[User, AuthError]:
         """Get the local anonymous user."""
-        if self._user is None:
+        if self._cached_ok is None:
             self._user = User(
                 id=self._user_id,
                 locale="en",
                 preferred_language=Language.PYTHON,
-                created_at=datetime.now(),
             )
-        return Ok(self._user)
+            self._cached_ok = Ok(self._user)
+        return self._cached_ok
 
     def authenticate(self, credentials: dict[str, Any]) -> Result[User, AuthError]:
         """
@@ -45,4 +46,6 @@ class AnonymousAuthProvider:
         For anonymous auth, this just returns the current user.
         Credentials are ignored.
         """
+        if self._cached_ok is not None:
+            return self._cached_ok
         return self.get_current_user()
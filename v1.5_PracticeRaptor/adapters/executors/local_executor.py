@@ -92,6 +92,11 @@ SAFE_BUILTINS: dict[str, Any] = {
 }
 
 
+# Test processes always use "spawn". A private context leaves the global
+# start method untouched and is not affected by whoever set it first.
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+
 def _create_sandbox_globals() -> dict[str, Any]:
     """Create restricted globals for code execution."""
     return {
@@ -216,8 +221,8 @@ class LocalExecutor:
         timeout_sec: int,
     ) -> Result[TestResult, ExecutionError]:
         """Run a single test case."""
-        result_queue: "multiprocessing.Queue[dict[str, Any]]" = multiprocessing.Queue()
-        process = multiprocessing.Process(
+        result_queue: "multiprocessing.Queue[dict[str, Any]]" = _SPAWN_CONTEXT.Queue()
+        process = _SPAWN_CONTEXT.Process(
             target=_execute_in_process,
             args=(code, test_case.input, function_name, result_queue),
         )
@@ -23,6 +23,7 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
     def __init__(self, problems_path: Path):
         super().__init__(problems_path)
         self._cache: dict[int, Problem] | None = None
+        self._sorted: tuple[Problem, ...] | None = None
 
     def _load_all(self) -> dict[int, Problem]:
         """Load all problems from files (with caching)."""
@@ -70,7 +71,7 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
             )
 
             # Parse language specs
-            languages: list[LanguageSpec] = []
+            languages: dict[Language, LanguageSpec] = {}
 
             # New format: languages dict
             for lang_key, lang_data in data.get("languages", {}).items():
@@ -84,11 +85,11 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
                         )
                         for s in lang_data.get("solutions", [])
                     )
-                    languages.append(LanguageSpec(
+                    languages[lang_enum] = LanguageSpec(
                         language=lang_enum,
                         function_signature=lang_data["function_signature"],
                         solutions=solutions,
-                    ))
+                    )
 
             # Support old format (python3 at root level)
             if "python3" in data and "languages" not in data:
@@ -101,11 +102,11 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
                     )
                     for s in lang_data.get("solutions", [])
                 )
-                languages.append(LanguageSpec(
+                languages[Language.PYTHON] = LanguageSpec(
                     language=Language.PYTHON,
                     function_signature=lang_data["function_signature"],
                     solutions=solutions,
-                ))
+                )
 
             # Parse hints
             hints = tuple(
@@ -120,7 +121,7 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
                 tags=tuple(data.get("tags", [])),
                 examples=examples,
                 test_cases=test_cases,
-                languages=tuple(languages),
+                languages=languages,
                 hints=hints,
             )
         except (KeyError, ValueError):
@@ -145,9 +146,11 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
         ))
 
     def get_all(self) -> tuple[Problem, ...]:
-        """Get all problems."""
-        problems = self._load_all()
-        return tuple(sorted(problems.values(), key=lambda p: p.id))
+        """Get all problems (sorted tuple is cached with the problems)."""
+        if self._sorted is None:
+            problems = self._load_all()
+            self._sorted = tuple(sorted(problems.values(), key=lambda p: p.id))
+        return self._sorted
 
     def filter(
         self,
@@ -155,25 +158,17 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
         tags: tuple[str, ...] | None = None,
         language: Language | None = None,
     ) -> tuple[Problem, ...]:
-        """Filter problems by criteria."""
-        problems = list(self.get_all())
-
-        if difficulty:
-            problems = [p for p in problems if p.difficulty == difficulty]
-
-        if tags:
-            problems = [
-                p for p in problems
-                if any(tag in p.tags for tag in tags)
-            ]
-
-        if language:
-            problems = [
-                p for p in problems
-                if p.get_language_spec(language) is not None
-            ]
-
-        return tuple(problems)
+        """Filter problems by criteria (single pass over cached problems)."""
+        problems = self.get_all()
+        if not (difficulty or tags or language):
+            return problems
+
+        return tuple(
+            p for p in problems
+            if (not difficulty or p.difficulty is difficulty)
+            and (not tags or any(tag in p.tags for tag in tags))
+            and (not language or p.get_language_spec(language) is not None)
+        )
 
     def count(self) -> int:
         """Get total number of problems."""
@@ -182,3 +177,4 @@ class JsonProblemRepository(JsonStorageBase[Problem]):
     def invalidate_cache(self) -> None:
         """Clear the cache to reload from files."""
         self._cache = None
+        self._sorted = None
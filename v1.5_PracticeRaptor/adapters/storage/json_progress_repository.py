@@ -89,7 +89,7 @@ class JsonProgressRepository(JsonStorageBase[Progress]):
     def get_solved_count(self, user_id: str) -> int:
         """Get number of solved problems for user."""
         all_progress = self.get_all_for_user(user_id)
-        return sum(1 for p in all_progress if p.status == ProgressStatus.SOLVED)
+        return sum(1 for p in all_progress if p.status is ProgressStatus.SOLVED)
 
     def get_solved_by_difficulty(
         self,
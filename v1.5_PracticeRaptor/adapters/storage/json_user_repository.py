@@ -1,4 +1,5 @@
 """JSON implementation of IUserRepository."""
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Any
@@ -21,15 +22,16 @@ class JsonUserRepository(JsonStorageBase[User]):
         return self.base_path / f"{user_id}.json"
 
     def _parse_user(self, data: dict[str, Any]) -> User:
-        created_at = None
+        # Missing created_at falls back to the model's default_factory
+        extra: dict[str, Any] = {}
         if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
+            extra["created_at"] = datetime.fromisoformat(data["created_at"])
 
         return User(
             id=data["id"],
-            locale=data.get("locale", "en"),
+            locale=sys.intern(data.get("locale", "en")),
             preferred_language=Language(data.get("preferred_language", "python3")),
-            created_at=created_at,
+            **extra,
         )
 
     def _serialize_user(self, user: User) -> dict[str, Any]:
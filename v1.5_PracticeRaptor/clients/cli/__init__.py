@@ -1,8 +1,20 @@
 """CLI client for PracticeRaptor."""
-from .app import CLIApp
+from typing import TYPE_CHECKING, Any
+
 from .main import main
 
+if TYPE_CHECKING:
+    from .app import CLIApp
+
 __all__ = [
     "CLIApp",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # CLIApp pulls in the whole service layer; load it only when requested
+    if name == "CLIApp":
+        from .app import CLIApp
+        return CLIApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
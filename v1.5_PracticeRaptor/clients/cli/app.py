@@ -3,7 +3,6 @@ import random
 
 from core.domain.models import Problem
 from core.domain.enums import Language
-from core.domain.result import Ok, Err
 from core.services import (
     get_all_problems,
     validate_code_syntax,
@@ -122,12 +121,15 @@ class CLIApp:
         verbose: bool,
     ) -> int:
         """Run interactive mode."""
+        select_problem = self._select_problem
+        solve_problem = self._solve_problem
+        should_continue = ask_continue
+
         while True:
             try:
-                problem = self._select_problem(problems)
-                self._solve_problem(problem, verbose)
+                solve_problem(select_problem(problems), verbose)
 
-                if not ask_continue():
+                if not should_continue():
                     break
 
             except KeyboardInterrupt:
@@ -141,10 +143,11 @@ class CLIApp:
         """Display problem list and get user selection."""
         display_problem_list(problems, self.locale)
 
-        choice = get_user_choice(0, len(problems))
+        count = len(problems)
+        choice = get_user_choice(0, count)
 
         if choice == 0:
-            problem = random.choice(problems)
+            problem = problems[random.randrange(count)]
             display_message(
                 f"\nRandom problem: {problem.title.get(self.locale)}",
                 "info",
@@ -171,11 +174,13 @@ class CLIApp:
         """
         display_problem(problem, self.language, self.locale)
 
+        lang_spec = problem.get_language_spec(self.language)
+        solutions = lang_spec.solutions if lang_spec else ()
         previous_code: str | None = None
 
         while True:
             # Get code from user
-            result = read_user_code(problem, self.language, previous_code)
+            result = read_user_code(solutions, previous_code)
 
             if result.cancelled:
                 display_message("\nCancelled.", "warning")
@@ -240,10 +245,11 @@ class CLIApp:
             executor=self.container.executor,
         )
 
-        match result:
-            case Ok(exec_result):
-                display_results(exec_result, verbose)
-                return exec_result.success
-            case Err(error):
-                display_message(f"\nx Execution error: {error.message}", "error")
-                return False
+        if result.is_ok():
+            exec_result = result.unwrap()
+            display_results(exec_result, verbose)
+            return exec_result.success
+
+        error = result.error
+        display_message(f"\nx Execution error: {error.message}", "error")
+        return False
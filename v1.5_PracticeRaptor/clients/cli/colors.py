@@ -1,46 +1,62 @@
 """ANSI color codes for terminal output."""
 
+RESET = "\033[0m"
+BOLD = "\033[1m"
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+CYAN = "\033[96m"
+GRAY = "\033[90m"
+
+
+def success(text: str) -> str:
+    """Green text for success."""
+    return GREEN + text + RESET
+
+
+def error(text: str) -> str:
+    """Red text for errors."""
+    return RED + text + RESET
+
+
+def warning(text: str) -> str:
+    """Yellow text for warnings."""
+    return YELLOW + text + RESET
+
+
+def info(text: str) -> str:
+    """Cyan text for info."""
+    return CYAN + text + RESET
+
+
+def muted(text: str) -> str:
+    """Gray text for secondary info."""
+    return GRAY + text + RESET
+
+
+def bold(text: str) -> str:
+    """Bold text."""
+    return BOLD + text + RESET
+
 
 class Colors:
     """ANSI escape codes for colored output."""
 
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    GREEN = "\033[92m"
-    RED = "\033[91m"
-    YELLOW = "\033[93m"
-    CYAN = "\033[96m"
-    GRAY = "\033[90m"
-
-    @classmethod
-    def success(cls, text: str) -> str:
-        """Green text for success."""
-        return f"{cls.GREEN}{text}{cls.RESET}"
-
-    @classmethod
-    def error(cls, text: str) -> str:
-        """Red text for errors."""
-        return f"{cls.RED}{text}{cls.RESET}"
-
-    @classmethod
-    def warning(cls, text: str) -> str:
-        """Yellow text for warnings."""
-        return f"{cls.YELLOW}{text}{cls.RESET}"
-
-    @classmethod
-    def info(cls, text: str) -> str:
-        """Cyan text for info."""
-        return f"{cls.CYAN}{text}{cls.RESET}"
-
-    @classmethod
-    def muted(cls, text: str) -> str:
-        """Gray text for secondary info."""
-        return f"{cls.GRAY}{text}{cls.RESET}"
-
-    @classmethod
-    def bold(cls, text: str) -> str:
-        """Bold text."""
-        return f"{cls.BOLD}{text}{cls.RESET}"
+    RESET = RESET
+    BOLD = BOLD
+    GREEN = GREEN
+    RED = RED
+    YELLOW = YELLOW
+    CYAN = CYAN
+    GRAY = GRAY
+
+    # Plain functions: no class binding on each call
+    success = staticmethod(success)
+    error = staticmethod(error)
+    warning = staticmethod(warning)
+    info = staticmethod(info)
+    muted = staticmethod(muted)
+    bold = staticmethod(bold)
 
 
 # Separators
@@ -1,8 +1,10 @@
 """User input handling for CLI."""
-from dataclasses import dataclass
+import sys
+from io import StringIO
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 
-from core.domain.models import Problem
-from core.domain.enums import Language
+from core.domain.models import Solution
 
 from .colors import Colors
 from .presenter import display_hint
@@ -32,13 +34,15 @@ def get_user_choice(min_val: int, max_val: int, prompt: str = "Choose") -> int:
 
 
 def read_user_code(
-    problem: Problem,
-    language: Language,
+    solutions: tuple[Solution, ...],
     previous_code: str | None = None,
 ) -> InputResult:
     """
     Read multiline code from user.
 
+    ``solutions`` are the canonical solutions shown by !hint; callers
+    resolve them once per problem rather than once per attempt.
+
     Supports commands:
     - !hint: Show canonical solution
     - !reset: Clear entered code
@@ -46,9 +50,7 @@ def read_user_code(
 
     Input ends with double Enter (two empty lines).
     """
-    hint_index = 0
-    lang_spec = problem.get_language_spec(language)
-    solutions = lang_spec.solutions if lang_spec else ()
+    state = _CodeInput(solutions=solutions)
 
     # Show previous code if any
     if previous_code:
@@ -56,53 +58,29 @@ def read_user_code(
 
     print("Enter your solution (double Enter to submit, !hint for help):")
 
-    lines: list[str] = []
-    empty_count = 0
-
-    while True:
-        try:
-            line = input(">>> ")
-        except EOFError:
-            break
+    for line in _input_lines():
+        stripped = line.strip()
 
         # Check commands
-        stripped = line.strip().lower()
-
-        if stripped == "!hint":
-            if solutions and hint_index < len(solutions):
-                sol = solutions[hint_index]
-                display_hint(sol.name, sol.complexity, sol.code, hint_index + 1, len(solutions))
-                hint_index += 1
-            elif not solutions:
-                print(Colors.warning("\nNo hints available for this problem.\n"))
-            else:
-                print(Colors.warning("\nNo more hints.\n"))
-            continue
-
-        if stripped == "!reset":
-            lines = []
-            empty_count = 0
-            print(Colors.info("Code cleared. Enter again:"))
+        handler = _COMMANDS.get(stripped.lower())
+        if handler is not None:
+            if handler(state) is _CANCEL:
+                return InputResult(cancelled=True)
             continue
 
-        if stripped == "!cancel":
-            return InputResult(cancelled=True)
-
         # Handle empty lines
-        if not line.strip():
-            empty_count += 1
-            if empty_count >= 2:
+        if not stripped:
+            state.empty_count += 1
+            if state.empty_count >= 2:
                 break
-            lines.append("")
+            state.buffer.write("\n")
         else:
-            empty_count = 0
-            lines.append(line)
+            state.empty_count = 0
+            state.buffer.write(line)
+            state.buffer.write("\n")
 
-    # Remove trailing empty lines
-    while lines and not lines[-1].strip():
-        lines.pop()
-
-    code = "\n".join(lines)
+    # Blank lines are stored empty, so this drops trailing ones
+    code = state.buffer.getvalue().rstrip("\n")
 
     if not code.strip():
         return InputResult(cancelled=True)
@@ -110,6 +88,76 @@ def read_user_code(
     return InputResult(code=code)
 
 
+@dataclass
+class _CodeInput:
+    """Mutable state of one read_user_code session."""
+
+    solutions: tuple[Solution, ...]
+    buffer: StringIO = field(default_factory=StringIO)
+    empty_count: int = 0
+    hint_index: int = 0
+
+
+# Returned by a command handler to abort input
+_CANCEL = object()
+
+
+def _handle_hint(state: _CodeInput) -> object | None:
+    """Show the next canonical solution."""
+    solutions = state.solutions
+    if solutions and state.hint_index < len(solutions):
+        sol = solutions[state.hint_index]
+        display_hint(
+            sol.name, sol.complexity, sol.code, state.hint_index + 1, len(solutions)
+        )
+        state.hint_index += 1
+    elif not solutions:
+        print(Colors.warning("\nNo hints available for this problem.\n"))
+    else:
+        print(Colors.warning("\nNo more hints.\n"))
+    return None
+
+
+def _handle_reset(state: _CodeInput) -> object | None:
+    """Discard the code entered so far."""
+    state.buffer = StringIO()
+    state.empty_count = 0
+    print(Colors.info("Code cleared. Enter again:"))
+    return None
+
+
+def _handle_cancel(state: _CodeInput) -> object | None:
+    """Abort input."""
+    return _CANCEL
+
+
+_COMMANDS: dict[str, Callable[[_CodeInput], object | None]] = {
+    "!hint": _handle_hint,
+    "!reset": _handle_reset,
+    "!cancel": _handle_cancel,
+}
+
+
+def _input_lines() -> Iterator[str]:
+    """
+    Yield lines of user input until EOF.
+
+    Piped stdin is read straight from the buffered stream without
+    printing prompts. Lines are pulled one at a time, so input meant
+    for later prompts stays unread once the caller stops iterating.
+    """
+    if sys.stdin.isatty():
+        while True:
+            try:
+                yield input(">>> ")
+            except EOFError:
+                return
+
+    readline = sys.stdin.readline
+    while line := readline():
+        yield line.rstrip("\n")
+
+
 def read_code_from_file(file_path: str) -> str:
     """Read code from file."""
     with open(file_path, "r", encoding="utf-8") as f:
@@ -135,9 +183,6 @@ def ask_retry() -> bool:
 
 def _show_previous_code(code: str) -> None:
     """Display previous code for reference."""
-    print(Colors.muted("\nPrevious code:"))
-    print(Colors.muted("+" + "-" * 38))
-    for line in code.split("\n"):
-        print(Colors.muted(f"| {line}"))
-    print(Colors.muted("+" + "-" * 38))
-    print()
+    border = "+" + "-" * 38
+    body = "\n".join("| " + line for line in code.splitlines() or [""])
+    print(Colors.muted(f"\nPrevious code:\n{border}\n{body}\n{border}"), end="\n\n")
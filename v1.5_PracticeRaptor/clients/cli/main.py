@@ -12,16 +12,21 @@ Options:
     --config PATH   Path to config file
     --help          Show this help
 """
-import argparse
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from di import load_config, create_container
-from .app import CLIApp
+if TYPE_CHECKING:
+    import argparse
 
+DEFAULT_CONFIG_PATH = Path("config/config.yaml")
 
-def parse_args() -> argparse.Namespace:
+
+def parse_args() -> "argparse.Namespace":
     """Parse command line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="PracticeRaptor CLI - Practice coding problems",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -56,7 +61,7 @@ Examples:
         "--config",
         "-c",
         type=Path,
-        default=Path("config/config.yaml"),
+        default=DEFAULT_CONFIG_PATH,
         help="Config file path",
     )
 
@@ -65,7 +70,21 @@ Examples:
 
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    args: "argparse.Namespace | SimpleNamespace"
+    if len(sys.argv) == 1:
+        # Plain interactive start: defaults only, no parser needed
+        args = SimpleNamespace(
+            task=None,
+            file=None,
+            verbose=False,
+            config=DEFAULT_CONFIG_PATH,
+        )
+    else:
+        args = parse_args()
+
+    # Imported after argument parsing so --help skips yaml, DI and services
+    from di import load_config, create_container
+    from .app import CLIApp
 
     # Load configuration
     try:
@@ -102,9 +121,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    # For multiprocessing on all platforms
-    import multiprocessing as mp
-
-    mp.set_start_method("spawn", force=True)
-
     sys.exit(main())
@@ -1,4 +1,5 @@
 """Output formatting for CLI."""
+import sys
 from typing import Any
 
 from core.domain.models import Problem, ExecutionResult, TestResult
@@ -20,8 +21,10 @@ def display_welcome() -> None:
 
 def display_problem_list(problems: tuple[Problem, ...], locale: str = "en") -> None:
     """Display list of available problems."""
-    print("\nAvailable problems:")
-    print(f"  [{Colors.info('0')}] Random problem")
+    lines = [
+        "\nAvailable problems:",
+        f"  [{Colors.info('0')}] Random problem",
+    ]
 
     for i, problem in enumerate(problems, 1):
         diff_color = _get_difficulty_color(problem.difficulty)
@@ -29,9 +32,10 @@ def display_problem_list(problems: tuple[Problem, ...], locale: str = "en") -> N
         tags_str = ", ".join(problem.tags)
         title = problem.title.get(locale)
 
-        print(f"  [{i}] {title} ({diff_str}) [{tags_str}]")
+        lines.append(f"  [{i}] {title} ({diff_str}) [{tags_str}]")
 
-    print()
+    lines.append("")
+    _write_lines(lines)
 
 
 def display_problem(
@@ -41,38 +45,40 @@ def display_problem(
 ) -> None:
     """Display full problem description."""
     # Header
-    print(SEPARATOR)
-    print(f"Problem #{problem.id}: {Colors.bold(problem.title.get(locale))}")
-
     diff_color = _get_difficulty_color(problem.difficulty)
-    print(f"Difficulty: {diff_color}{problem.difficulty.value}{Colors.RESET}")
-    print(f"Tags: {', '.join(problem.tags)}")
-    print(SEPARATOR)
+    lines = [
+        SEPARATOR,
+        f"Problem #{problem.id}: {Colors.bold(problem.title.get(locale))}",
+        f"Difficulty: {diff_color}{problem.difficulty.value}{Colors.RESET}",
+        f"Tags: {', '.join(problem.tags)}",
+        SEPARATOR,
+    ]
 
     # Description
-    print()
+    lines.append("")
     description = problem.description.get(locale)
     # Handle escaped newlines from JSON
-    print(description.replace("\\n", "\n"))
+    lines.append(description.replace("\\n", "\n"))
 
     # Examples
     examples = format_examples(problem, locale)
     for ex in examples:
         ex_num = ex["number"]
-        print(f"\n{Colors.bold(f'Example {ex_num}:')}")
-        print(f"  Input: {_format_input(ex['input'])}")
-        print(f"  Output: {ex['output']}")
+        lines.append(f"\n{Colors.bold(f'Example {ex_num}:')}")
+        lines.append(f"  Input: {_format_input(ex['input'])}")
+        lines.append(f"  Output: {ex['output']}")
         if "explanation" in ex:
-            print(f"  {Colors.muted('Explanation: ' + ex['explanation'])}")
+            lines.append(f"  {Colors.muted('Explanation: ' + ex['explanation'])}")
 
     # Function signature
     lang_spec = problem.get_language_spec(language)
     if lang_spec:
-        print(f"\n{Colors.bold('Function signature:')}")
-        print(f"  {Colors.info(lang_spec.function_signature)}")
+        lines.append(f"\n{Colors.bold('Function signature:')}")
+        lines.append(f"  {Colors.info(lang_spec.function_signature)}")
 
-    print()
-    print(SEPARATOR)
+    lines.append("")
+    lines.append(SEPARATOR)
+    _write_lines(lines)
 
 
 def display_results(result: ExecutionResult, verbose: bool = False) -> None:
@@ -128,6 +134,12 @@ def display_message(message: str, style: str = "info") -> None:
             print(Colors.info(message))
 
 
+def _write_lines(lines: list[str]) -> None:
+    """Write a whole frame of lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def _get_difficulty_color(difficulty: Difficulty) -> str:
     """Get color for difficulty level."""
     match difficulty:
@@ -1,34 +1,38 @@
 """Domain layer - models, enums, errors, result type."""
-from .enums import Difficulty, Language, SubmissionStatus, ProgressStatus
-from .errors import (
-    DomainError,
-    NotFoundError,
-    ValidationError,
-    ExecutionError,
-    StorageError,
-)
-from .result import Ok, Err, Result
-from .models import (
-    LocalizedText,
-    Example,
-    TestCase,
-    Solution,
-    LanguageSpec,
-    Problem,
-    User,
-    Draft,
-    Submission,
-    Progress,
-    TestResult,
-    ExecutionResult,
-)
-from .factories import (
-    create_user,
-    create_draft,
-    create_submission,
-    create_progress,
-    create_initial_progress,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .enums import Difficulty, Language, SubmissionStatus, ProgressStatus
+    from .errors import (
+        DomainError,
+        NotFoundError,
+        ValidationError,
+        ExecutionError,
+        StorageError,
+    )
+    from .result import Ok, Err, Result
+    from .models import (
+        LocalizedText,
+        Example,
+        TestCase,
+        Solution,
+        LanguageSpec,
+        Problem,
+        User,
+        Draft,
+        Submission,
+        Progress,
+        TestResult,
+        ExecutionResult,
+    )
+    from .factories import (
+        create_user,
+        create_draft,
+        create_submission,
+        create_progress,
+        create_initial_progress,
+    )
 
 __all__ = [
     # Enums
@@ -66,3 +70,54 @@ __all__ = [
     "create_progress",
     "create_initial_progress",
 ]
+
+# Public name -> defining submodule; submodules load on first access
+_LAZY_EXPORTS: dict[str, str] = {
+    name: module
+    for module, names in {
+        ".enums": ("Difficulty", "Language", "SubmissionStatus", "ProgressStatus"),
+        ".errors": (
+            "DomainError",
+            "NotFoundError",
+            "ValidationError",
+            "ExecutionError",
+            "StorageError",
+        ),
+        ".result": ("Ok", "Err", "Result"),
+        ".models": (
+            "LocalizedText",
+            "Example",
+            "TestCase",
+            "Solution",
+            "LanguageSpec",
+            "Problem",
+            "User",
+            "Draft",
+            "Submission",
+            "Progress",
+            "TestResult",
+            "ExecutionResult",
+        ),
+        ".factories": (
+            "create_user",
+            "create_draft",
+            "create_submission",
+            "create_progress",
+            "create_initial_progress",
+        ),
+    }.items()
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,18 @@
-"""Domain enumerations."""
-from enum import Enum
+"""Domain enumerations.
 
+Members are singletons; compare them with ``is`` rather than ``==``.
+"""
+from enum import StrEnum
 
-class Difficulty(str, Enum):
+
+class Difficulty(StrEnum):
     """Problem difficulty levels."""
     EASY = "easy"
     MEDIUM = "medium"
     HARD = "hard"
 
 
-class Language(str, Enum):
+class Language(StrEnum):
     """Supported programming languages."""
     PYTHON = "python3"
     GO = "go"
@@ -17,7 +20,7 @@ class Language(str, Enum):
     JAVASCRIPT = "javascript"
 
 
-class SubmissionStatus(str, Enum):
+class SubmissionStatus(StrEnum):
     """Status of a submission."""
     ACCEPTED = "accepted"
     WRONG_ANSWER = "wrong_answer"
@@ -26,7 +29,7 @@ class SubmissionStatus(str, Enum):
     MEMORY_LIMIT = "memory_limit"
 
 
-class ProgressStatus(str, Enum):
+class ProgressStatus(StrEnum):
     """User progress on a problem."""
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
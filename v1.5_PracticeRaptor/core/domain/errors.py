@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainError:
     """Base class for domain errors."""
     message: str
@@ -12,7 +12,7 @@ class DomainError:
         return self.message
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotFoundError(DomainError):
     """Entity not found."""
     entity: str = ""
@@ -27,19 +27,19 @@ class NotFoundError(DomainError):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationError(DomainError):
     """Validation failed."""
     field: Union[str, None] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionError(DomainError):
     """Code execution failed."""
     error_type: str = ""  # syntax, runtime, timeout, memory
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageError(DomainError):
     """Storage operation failed."""
     operation: str = ""  # read, write, delete
@@ -1,6 +1,8 @@
 """Domain models - immutable data structures."""
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 from .enums import Difficulty, Language, ProgressStatus
@@ -10,20 +12,27 @@ from .enums import Difficulty, Language, ProgressStatus
 # Value Objects
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocalizedText:
     """Text with translations."""
     translations: dict[str, str] = field(default_factory=dict)
+    _en: str = field(init=False, compare=False, hash=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_en", self.translations.get("en", ""))
 
     def get(self, locale: str, fallback: str = "en") -> str:
         """Get text for locale with fallback."""
-        return self.translations.get(locale, self.translations.get(fallback, ""))
+        text = self.translations.get(locale)
+        if text is not None:
+            return text
+        return self.translations.get(fallback, "")
 
     def __str__(self) -> str:
-        return self.get("en")
+        return self._en
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Example:
     """Problem example with input/output."""
     input: dict[str, Any]
@@ -31,7 +40,7 @@ class Example:
     explanation: LocalizedText | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Test case for validation."""
     input: dict[str, Any]
@@ -40,7 +49,7 @@ class TestCase:
     is_hidden: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Solution:
     """Canonical/reference solution."""
     name: str
@@ -48,7 +57,7 @@ class Solution:
     code: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LanguageSpec:
     """Language-specific problem data."""
     language: Language
@@ -60,7 +69,7 @@ class LanguageSpec:
 # Entities
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Problem:
     """Coding problem entity."""
     id: int
@@ -70,31 +79,47 @@ class Problem:
     tags: tuple[str, ...] = ()
     examples: tuple[Example, ...] = ()
     test_cases: tuple[TestCase, ...] = ()
-    languages: tuple[LanguageSpec, ...] = ()
+    languages: Mapping[Language, LanguageSpec] = field(
+        default_factory=lambda: MappingProxyType({}),
+    )
     hints: tuple[LocalizedText, ...] = ()
+    # Partitions of test_cases by is_hidden, computed once on construction
+    visible_test_cases: tuple[TestCase, ...] = field(
+        init=False, compare=False, repr=False,
+    )
+    hidden_test_cases: tuple[TestCase, ...] = field(
+        init=False, compare=False, repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        # Keep the frozen contract: callers may pass a plain dict
+        if not isinstance(self.languages, MappingProxyType):
+            object.__setattr__(
+                self, "languages", MappingProxyType(dict(self.languages))
+            )
+
+        visible: list[TestCase] = []
+        hidden: list[TestCase] = []
+        for test_case in self.test_cases:
+            (hidden if test_case.is_hidden else visible).append(test_case)
+        object.__setattr__(self, "visible_test_cases", tuple(visible))
+        object.__setattr__(self, "hidden_test_cases", tuple(hidden))
 
     def get_language_spec(self, language: Language) -> LanguageSpec | None:
         """Get spec for specific language."""
-        for spec in self.languages:
-            if spec.language == language:
-                return spec
-        return None
+        return self.languages.get(language)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """User entity."""
     id: str
     locale: str = "en"
     preferred_language: Language = Language.PYTHON
-    created_at: datetime | None = None
-
-    def __post_init__(self) -> None:
-        if self.created_at is None:
-            object.__setattr__(self, 'created_at', datetime.now())
+    created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Draft:
     """Unsaved user code."""
     user_id: str
@@ -104,7 +129,7 @@ class Draft:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Submission:
     """Successful submission."""
     id: str
@@ -117,7 +142,7 @@ class Submission:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Progress:
     """User progress on a problem."""
     user_id: str
@@ -132,7 +157,7 @@ class Progress:
 # Result Objects (for execution)
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestResult:
     """Result of running a single test."""
     test_case: TestCase
@@ -142,7 +167,7 @@ class TestResult:
     error_message: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """Result of running all tests."""
     success: bool
@@ -150,11 +175,12 @@ class ExecutionResult:
     total_time_ms: int = 0
     memory_used_kb: int = 0
     error: str | None = None
+    passed_count: int = field(init=False)
 
-    @property
-    def passed_count(self) -> int:
-        """Count of passed tests."""
-        return sum(1 for r in self.test_results if r.passed)
+    def __post_init__(self) -> None:
+        # Counted once here; results are immutable so it never goes stale
+        passed = sum(1 for r in self.test_results if r.passed)
+        object.__setattr__(self, "passed_count", passed)
 
     @property
     def total_count(self) -> int:
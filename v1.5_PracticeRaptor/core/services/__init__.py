@@ -17,8 +17,10 @@ from .execution import (
 from .progress import (
     get_user_progress,
     update_progress_on_attempt,
+    replay_attempts,
     calculate_user_stats,
     calculate_stats_by_difficulty,
+    calculate_all_stats,
 )
 from .drafts import (
     get_draft,
@@ -44,8 +46,10 @@ __all__ = [
     # Progress
     "get_user_progress",
     "update_progress_on_attempt",
+    "replay_attempts",
     "calculate_user_stats",
     "calculate_stats_by_difficulty",
+    "calculate_all_stats",
     # Drafts
     "get_draft",
     "save_draft",
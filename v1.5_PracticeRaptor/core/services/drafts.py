@@ -1,13 +1,20 @@
 """Draft management pure functions."""
 from datetime import datetime
+from functools import lru_cache
 
 from core.domain.models import Draft
 from core.domain.enums import Language
-from core.domain.result import Ok, Err, Result
+from core.domain.result import Result
 from core.domain.errors import NotFoundError, StorageError
 from core.ports.repositories import IDraftRepository
 
 
+@lru_cache(maxsize=256)
+def _template_for(signature: str) -> str:
+    """Starter code for a signature (signatures are static per problem)."""
+    return f"{signature}\n    pass"
+
+
 def get_draft(
     user_id: str,
     problem_id: int,
@@ -55,9 +62,7 @@ def get_or_create_code(
 ) -> str:
     """Get draft code or return template with signature."""
     result = get_draft(user_id, problem_id, language, draft_repo)
-    match result:
-        case Ok(draft):
-            return draft.code
-        case Err(_):
-            # Return template with just the signature
-            return f"{signature}\n    pass"
+    if result.is_ok():
+        return result.unwrap().code
+    # Return template with just the signature
+    return _template_for(signature)
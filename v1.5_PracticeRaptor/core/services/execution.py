@@ -8,6 +8,19 @@ from core.domain.result import Ok, Err, Result
 from core.domain.errors import ValidationError, ExecutionError
 from core.ports.executors import ICodeExecutor
 
+# "def two_sum(nums: list[int], target: int) -> list[int]:"
+_SIGNATURE_RE = re.compile(r'def\s+(\w+)\s*\(')
+
+# Problems rarely have more than a handful of examples
+_EXAMPLE_DESCRIPTIONS = tuple(f"Example {i}" for i in range(1, 11))
+
+
+def _example_description(index: int) -> str:
+    """Description for the 0-based example index."""
+    if index < len(_EXAMPLE_DESCRIPTIONS):
+        return _EXAMPLE_DESCRIPTIONS[index]
+    return f"Example {index + 1}"
+
 
 def validate_code_syntax(code: str) -> Result[str, ValidationError]:
     """Validate Python code syntax."""
@@ -29,8 +42,7 @@ def validate_code_syntax(code: str) -> Result[str, ValidationError]:
 
 def extract_function_name(signature: str) -> str:
     """Extract function name from signature."""
-    # "def two_sum(nums: list[int], target: int) -> list[int]:"
-    match = re.match(r'def\s+(\w+)\s*\(', signature)
+    match = _SIGNATURE_RE.match(signature)
     if match:
         return match.group(1)
     return "solution"
@@ -67,14 +79,14 @@ def run_examples_only(
         ))
 
     # Convert examples to test cases
-    example_tests = tuple(
+    example_tests = tuple([
         TestCase(
             input=ex.input,
             expected=ex.output,
-            description=f"Example {i+1}",
+            description=_example_description(i),
         )
         for i, ex in enumerate(problem.examples)
-    )
+    ])
 
     function_name = extract_function_name(lang_spec.function_signature)
 
@@ -1,12 +1,19 @@
 """Problem-related pure functions."""
 import random
+from collections.abc import Callable, Iterable
 
-from core.domain.models import Problem
+from core.domain.models import LocalizedText, Problem
 from core.domain.enums import Difficulty, Language
 from core.domain.result import Ok, Err, Result
 from core.domain.errors import NotFoundError
 from core.ports.repositories import IProblemRepository
 
+# Random draws tried before falling back to filtering out exclusions
+_MAX_SAMPLE_ATTEMPTS = 8
+
+# Plain str display labels, so callers never receive the enum member
+_DIFFICULTY_LABEL: dict[Difficulty, str] = {d: d.value for d in Difficulty}
+
 
 def get_problem(
     problem_id: int,
@@ -23,6 +30,7 @@ def get_all_problems(repo: IProblemRepository) -> tuple[Problem, ...]:
 
 def filter_problems(
     repo: IProblemRepository,
+    *,
     difficulty: Difficulty | None = None,
     tags: tuple[str, ...] | None = None,
     language: Language | None = None,
@@ -36,11 +44,28 @@ def get_random_problem(
     difficulty: Difficulty | None = None,
     tags: tuple[str, ...] | None = None,
     language: Language | None = None,
-    exclude_ids: tuple[int, ...] = (),
+    exclude_ids: Iterable[int] = (),
 ) -> Result[Problem, NotFoundError]:
-    """Get random problem matching criteria."""
-    problems = filter_problems(repo, difficulty, tags, language)
-    available = tuple(p for p in problems if p.id not in exclude_ids)
+    """
+    Get random problem matching criteria.
+
+    ``exclude_ids`` may be any iterable; it is frozen into a frozenset
+    once (a frozenset argument is used as-is) for O(1) membership.
+    """
+    excluded = frozenset(exclude_ids)
+    problems = repo.filter(difficulty=difficulty, tags=tags, language=language)
+    if not excluded and problems:
+        return Ok(problems[random.randrange(len(problems))])
+
+    # Rejection sampling keeps the pick uniform without copying problems;
+    # only fall back to filtering when most of them are excluded.
+    if problems and len(excluded) < len(problems):
+        for _ in range(_MAX_SAMPLE_ATTEMPTS):
+            problem = problems[random.randrange(len(problems))]
+            if problem.id not in excluded:
+                return Ok(problem)
+
+    available = tuple(p for p in problems if p.id not in excluded)
 
     if not available:
         return Err(NotFoundError(
@@ -56,10 +81,11 @@ def get_problem_display_text(
     locale: str = "en",
 ) -> dict[str, str]:
     """Get problem text for display."""
+    localized = _make_localized_getter(locale)
     return {
-        "title": problem.title.get(locale),
-        "description": problem.description.get(locale),
-        "difficulty": problem.difficulty.value,
+        "title": localized(problem.title),
+        "description": localized(problem.description),
+        "difficulty": _DIFFICULTY_LABEL[problem.difficulty],
         "tags": ", ".join(problem.tags),
     }
 
@@ -69,14 +95,26 @@ def format_examples(
     locale: str = "en",
 ) -> list[dict]:
     """Format examples for display."""
-    result = []
-    for i, example in enumerate(problem.examples, 1):
-        item = {
+    localized = _make_localized_getter(locale)
+    return [
+        {
             "number": i,
             "input": example.input,
             "output": example.output,
+            **(
+                {"explanation": localized(example.explanation)}
+                if example.explanation
+                else {}
+            ),
         }
-        if example.explanation:
-            item["explanation"] = example.explanation.get(locale)
-        result.append(item)
-    return result
+        for i, example in enumerate(problem.examples, 1)
+    ]
+
+
+def _make_localized_getter(locale: str) -> Callable[[LocalizedText], str]:
+    """Build a resolver for ``locale`` (English fallback), once per render."""
+    def get(text: LocalizedText) -> str:
+        translations = text.translations
+        value = translations.get(locale)
+        return value if value is not None else translations.get("en", "")
+    return get
@@ -1,11 +1,21 @@
 """Progress tracking pure functions."""
+from collections.abc import Callable, Iterable
+from dataclasses import replace
 from datetime import datetime
 
 from core.domain.models import Progress
 from core.domain.enums import Difficulty, Language, ProgressStatus
-from core.domain.result import Ok, Err
 from core.ports.repositories import IProgressRepository
 
+_SOLVED = ProgressStatus.SOLVED
+_IN_PROGRESS = ProgressStatus.IN_PROGRESS
+
+# Seed for per-difficulty stats; copied per call, never mutated
+_ALL_DIFFICULTIES: tuple[Difficulty, ...] = tuple(Difficulty)
+_INITIAL_DIFFICULTY_STATS: dict[Difficulty, dict[str, int]] = {
+    d: {"solved": 0, "total": 0} for d in _ALL_DIFFICULTIES
+}
+
 
 def get_user_progress(
     user_id: str,
@@ -14,55 +24,90 @@ def get_user_progress(
 ) -> Progress:
     """Get user progress for a problem, creating initial if not exists."""
     result = progress_repo.get(user_id, problem_id)
-    match result:
-        case Ok(progress):
-            return progress
-        case Err(_):
-            return Progress(
-                user_id=user_id,
-                problem_id=problem_id,
-                status=ProgressStatus.NOT_STARTED,
-                attempts=0,
-                solved_languages=(),
-            )
+    if result.is_ok():
+        return result.unwrap()
+
+    return Progress(
+        user_id=user_id,
+        problem_id=problem_id,
+        status=ProgressStatus.NOT_STARTED,
+        attempts=0,
+        solved_languages=(),
+    )
 
 
 def update_progress_on_attempt(
     progress: Progress,
     solved: bool,
     language: Language,
+    *,
+    now_fn: Callable[[], datetime] = datetime.now,
 ) -> Progress:
-    """Create updated progress after an attempt (immutable)."""
-    new_attempts = progress.attempts + 1
+    """
+    Create updated progress after an attempt (immutable).
 
+    ``now_fn`` supplies first_solved_at and is called only on
+    the first successful attempt.
+    """
     if solved:
-        new_languages = progress.solved_languages
-        if language not in new_languages:
-            new_languages = (*new_languages, language)
-
-        return Progress(
-            user_id=progress.user_id,
-            problem_id=progress.problem_id,
-            status=ProgressStatus.SOLVED,
-            attempts=new_attempts,
-            solved_languages=new_languages,
-            first_solved_at=progress.first_solved_at or datetime.now(),
-        )
-    else:
-        new_status = (
-            ProgressStatus.SOLVED
-            if progress.status == ProgressStatus.SOLVED
-            else ProgressStatus.IN_PROGRESS
-        )
-        return Progress(
-            user_id=progress.user_id,
-            problem_id=progress.problem_id,
-            status=new_status,
-            attempts=new_attempts,
-            solved_languages=progress.solved_languages,
-            first_solved_at=progress.first_solved_at,
+        languages = progress.solved_languages
+        if language not in languages:
+            languages = languages + (language,)
+
+        return replace(
+            progress,
+            status=_SOLVED,
+            attempts=progress.attempts + 1,
+            solved_languages=languages,
+            first_solved_at=progress.first_solved_at or now_fn(),
         )
 
+    return replace(
+        progress,
+        status=_SOLVED if progress.status is _SOLVED else _IN_PROGRESS,
+        attempts=progress.attempts + 1,
+    )
+
+
+def replay_attempts(
+    progress: Progress,
+    attempts: Iterable[tuple[bool, Language]],
+    *,
+    now_fn: Callable[[], datetime] = datetime.now,
+) -> Progress:
+    """
+    Apply a sequence of (solved, language) attempts at once.
+
+    Equivalent to folding update_progress_on_attempt over attempts, but
+    collects solved languages in a list and builds one Progress at the end.
+    """
+    status = progress.status
+    count = progress.attempts
+    languages = list(progress.solved_languages)
+    first_solved_at = progress.first_solved_at
+
+    for solved, language in attempts:
+        count += 1
+        if solved:
+            status = _SOLVED
+            if language not in languages:
+                languages.append(language)
+            if first_solved_at is None:
+                first_solved_at = now_fn()
+        elif status is not _SOLVED:
+            status = _IN_PROGRESS
+
+    if count == progress.attempts:
+        return progress
+
+    return replace(
+        progress,
+        status=status,
+        attempts=count,
+        solved_languages=tuple(languages),
+        first_solved_at=first_solved_at,
+    )
+
 
 def calculate_user_stats(
     user_id: str,
@@ -70,14 +115,22 @@ def calculate_user_stats(
 ) -> dict:
     """Calculate overall user statistics."""
     all_progress = progress_repo.get_all_for_user(user_id)
+    if not all_progress:
+        return {"total_solved": 0, "in_progress": 0, "total_attempts": 0}
 
-    solved = [p for p in all_progress if p.status == ProgressStatus.SOLVED]
-    in_progress = [p for p in all_progress if p.status == ProgressStatus.IN_PROGRESS]
+    solved_status = _SOLVED
+    in_progress_status = _IN_PROGRESS
+    solved = in_progress = attempts = 0
+    for progress in all_progress:
+        status = progress.status
+        solved += status is solved_status
+        in_progress += status is in_progress_status
+        attempts += progress.attempts
 
     return {
-        "total_solved": len(solved),
-        "in_progress": len(in_progress),
-        "total_attempts": sum(p.attempts for p in all_progress),
+        "total_solved": solved,
+        "in_progress": in_progress,
+        "total_attempts": attempts,
     }
 
 
@@ -88,14 +141,48 @@ def calculate_stats_by_difficulty(
 ) -> dict[Difficulty, dict]:
     """Calculate stats grouped by difficulty."""
     all_progress = progress_repo.get_all_for_user(user_id)
+    return _summarize(all_progress, problem_difficulties)[1]
 
-    stats: dict[Difficulty, dict] = {d: {"solved": 0, "total": 0} for d in Difficulty}
+
+def calculate_all_stats(
+    user_id: str,
+    progress_repo: IProgressRepository,
+    problem_difficulties: dict[int, Difficulty],
+) -> tuple[dict, dict[Difficulty, dict]]:
+    """Calculate overall and per-difficulty stats in one pass."""
+    all_progress = progress_repo.get_all_for_user(user_id)
+    return _summarize(all_progress, problem_difficulties)
+
+
+def _summarize(
+    all_progress: tuple[Progress, ...],
+    problem_difficulties: dict[int, Difficulty],
+) -> tuple[dict, dict[Difficulty, dict]]:
+    """Accumulate overall and per-difficulty counters in a single loop."""
+    solved = in_progress = attempts = 0
+    stats: dict[Difficulty, dict] = {
+        d: counts.copy() for d, counts in _INITIAL_DIFFICULTY_STATS.items()
+    }
 
     for progress in all_progress:
+        attempts += progress.attempts
+        status = progress.status
+        is_solved = status is _SOLVED
+        if is_solved:
+            solved += 1
+        elif status is _IN_PROGRESS:
+            in_progress += 1
+
         difficulty = problem_difficulties.get(progress.problem_id)
         if difficulty:
-            stats[difficulty]["total"] += 1
-            if progress.status == ProgressStatus.SOLVED:
-                stats[difficulty]["solved"] += 1
-
-    return stats
+            bucket = stats[difficulty]
+            bucket["total"] += 1
+            if is_solved:
+                bucket["solved"] += 1
+
+    totals = {
+        "total_solved": solved,
+        "in_progress": in_progress,
+        "total_attempts": attempts,
+    }
+    return totals, stats
@@ -1,24 +1,26 @@
 """Configuration loading and models."""
+import json
+import os
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-import yaml
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JsonStorageConfig:
     """JSON storage configuration."""
     base_path: Path = field(default_factory=lambda: Path("./data"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SqliteStorageConfig:
     """SQLite storage configuration."""
     path: Path = field(default_factory=lambda: Path("./data/practiceraptor.db"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostgresStorageConfig:
     """PostgreSQL storage configuration."""
     host: str = "localhost"
@@ -28,7 +30,7 @@ class PostgresStorageConfig:
     password: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     """Storage configuration."""
     type: str = "json"  # json | sqlite | postgresql
@@ -37,7 +39,7 @@ class StorageConfig:
     postgresql: PostgresStorageConfig = field(default_factory=PostgresStorageConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutorConfig:
     """Executor configuration."""
     type: str = "local"  # local | docker | remote
@@ -45,13 +47,13 @@ class ExecutorConfig:
     memory_limit_mb: int = 256
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthConfig:
     """Authentication configuration."""
     type: str = "anonymous"  # anonymous | telegram | token
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration."""
     name: str = "PracticeRaptor"
@@ -59,7 +61,7 @@ class AppConfig:
     default_locale: str = "en"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """Root configuration."""
     app: AppConfig = field(default_factory=AppConfig)
@@ -68,41 +70,145 @@ class Config:
     auth: AuthConfig = field(default_factory=AuthConfig)
 
 
+# Shared read-only fallbacks; all config classes are frozen
+_EMPTY: dict[str, Any] = {}
+_DEFAULT_CONFIG = Config()
+
+# Parsed configs keyed by absolute path: (mtime_ns, size, config).
+# Config objects are frozen, so cached instances are shared as-is.
+_CONFIG_CACHE_SIZE = 32
+_config_cache: "OrderedDict[str, tuple[int, int, Config]]" = OrderedDict()
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from YAML file.
 
+    Parsed configs are cached per path and reused while the file's
+    mtime and size are unchanged. Across processes, a JSON sidecar
+    (``config.yaml.json``) stores the parsed data so later runs can
+    skip the YAML parser.
+
     Args:
         config_path: Path to config file. If None, uses defaults.
 
     Returns:
         Config object with loaded or default values.
     """
-    if config_path is None or not config_path.exists():
-        return Config()
+    if config_path is None:
+        return _DEFAULT_CONFIG
+
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        return _DEFAULT_CONFIG
+
+    key = str(config_path.absolute())
+    cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _config_cache.move_to_end(key)
+        return cached[2]
+
+    data = _read_sidecar(config_path, stat)
+    if data is None:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = _load_yaml(f) or {}
+        _write_sidecar(config_path, stat, data)
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or {}
+    config = _parse_config(data)
+    _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+    _config_cache.move_to_end(key)
+    if len(_config_cache) > _CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
 
-    return _parse_config(data)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs (e.g. after editing files in tests)."""
+    _config_cache.clear()
+
+
+def _load_yaml(stream: IO[str]) -> Any:
+    """
+    Parse YAML from stream.
+
+    PyYAML is imported here rather than at module level so importing
+    the DI package (and loading from a fresh sidecar) never pays for it.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    loader = yaml.CSafeLoader if hasattr(yaml, "CSafeLoader") else yaml.SafeLoader
+    return yaml.load(stream, Loader=loader)
+
+
+def _sidecar_path(config_path: Path) -> Path:
+    """Path of the JSON cache stored next to the YAML file."""
+    return config_path.with_suffix(config_path.suffix + ".json")
+
+
+def _read_sidecar(config_path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+    """Read parsed data from the JSON sidecar if it matches the YAML file."""
+    try:
+        with open(_sidecar_path(config_path), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("source_mtime_ns") != stat.st_mtime_ns
+        or cached.get("source_size") != stat.st_size
+        or not isinstance(cached.get("data"), dict)
+    ):
+        return None
+    return cached["data"]
+
+
+def _write_sidecar(
+    config_path: Path,
+    stat: os.stat_result,
+    data: dict[str, Any],
+) -> None:
+    """Write parsed data to the JSON sidecar (best effort)."""
+    payload = {
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "data": data,
+    }
+    try:
+        content = json.dumps(payload, ensure_ascii=False)
+        _sidecar_path(config_path).write_text(content, encoding='utf-8')
+    except (OSError, TypeError, ValueError):
+        # Non-JSON YAML values or read-only location: YAML stays the source.
+        pass
+
+
+def _intern(value: Any) -> Any:
+    """Intern short config strings compared on every lookup (locale, types)."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def _parse_config(data: dict[str, Any]) -> Config:
     """Parse configuration dictionary into Config object."""
-    app_data = data.get("app", {})
+    if not data:
+        return _DEFAULT_CONFIG
+
+    app_data = data.get("app") or _EMPTY
     app = AppConfig(
         name=app_data.get("name", "PracticeRaptor"),
         environment=app_data.get("environment", "development"),
-        default_locale=app_data.get("default_locale", "en"),
+        default_locale=_intern(app_data.get("default_locale", "en")),
     )
 
-    storage_data = data.get("storage", {})
-    json_data = storage_data.get("json", {})
-    sqlite_data = storage_data.get("sqlite", {})
-    pg_data = storage_data.get("postgresql", {})
+    storage_data = data.get("storage") or _EMPTY
+    json_data = storage_data.get("json") or _EMPTY
+    sqlite_data = storage_data.get("sqlite") or _EMPTY
+    pg_data = storage_data.get("postgresql") or _EMPTY
 
     storage = StorageConfig(
-        type=storage_data.get("type", "json"),
+        type=_intern(storage_data.get("type", "json")),
         json=JsonStorageConfig(
             base_path=Path(json_data.get("base_path", "./data")),
         ),
@@ -118,16 +224,16 @@ def _parse_config(data: dict[str, Any]) -> Config:
         ),
     )
 
-    executor_data = data.get("executor", {})
+    executor_data = data.get("executor") or _EMPTY
     executor = ExecutorConfig(
-        type=executor_data.get("type", "local"),
+        type=_intern(executor_data.get("type", "local")),
         timeout_sec=executor_data.get("timeout_sec", 5),
         memory_limit_mb=executor_data.get("memory_limit_mb", 256),
     )
 
-    auth_data = data.get("auth", {})
+    auth_data = data.get("auth") or _EMPTY
     auth = AuthConfig(
-        type=auth_data.get("type", "anonymous"),
+        type=_intern(auth_data.get("type", "anonymous")),
     )
 
     return Config(
@@ -1,5 +1,7 @@
 """Dependency Injection container."""
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from typing import Any
 
 from core.ports.repositories import (
     IProblemRepository,
@@ -12,22 +14,103 @@ from core.ports.executors import ICodeExecutor
 from core.ports.auth import IAuthProvider
 
 
-@dataclass(frozen=True)
 class Container:
     """
     Immutable container holding all application dependencies.
 
     Created once at application startup and passed to all components
     that need access to repositories, executor, or auth.
+
+    Dependencies passed to the constructor are used as-is. Containers
+    built with from_providers() resolve each dependency on first
+    access instead, so backends a command never touches are never
+    constructed.
     """
-    problem_repo: IProblemRepository
-    user_repo: IUserRepository
-    draft_repo: IDraftRepository
-    submission_repo: ISubmissionRepository
-    progress_repo: IProgressRepository
-    executor: ICodeExecutor
-    auth: IAuthProvider
-
-    # Configuration
-    default_locale: str = "en"
-    default_timeout_sec: int = 5
+
+    def __init__(
+        self,
+        problem_repo: IProblemRepository,
+        user_repo: IUserRepository,
+        draft_repo: IDraftRepository,
+        submission_repo: ISubmissionRepository,
+        progress_repo: IProgressRepository,
+        executor: ICodeExecutor,
+        auth: IAuthProvider,
+        default_locale: str = "en",
+        default_timeout_sec: int = 5,
+    ) -> None:
+        # Instance values shadow the lazy properties below
+        self.__dict__.update(
+            problem_repo=problem_repo,
+            user_repo=user_repo,
+            draft_repo=draft_repo,
+            submission_repo=submission_repo,
+            progress_repo=progress_repo,
+            executor=executor,
+            auth=auth,
+            default_locale=default_locale,
+            default_timeout_sec=default_timeout_sec,
+        )
+
+    @classmethod
+    def from_providers(
+        cls,
+        providers: Mapping[str, Callable[[], Any]],
+        default_locale: str = "en",
+        default_timeout_sec: int = 5,
+    ) -> "Container":
+        """
+        Create container that builds dependencies on first access.
+
+        Args:
+            providers: Zero-argument factories keyed by dependency name
+            default_locale: Default locale for clients
+            default_timeout_sec: Default execution timeout
+
+        Returns:
+            Container resolving dependencies lazily
+        """
+        container = cls.__new__(cls)
+        container.__dict__.update(
+            _providers=dict(providers),
+            default_locale=default_locale,
+            default_timeout_sec=default_timeout_sec,
+        )
+        return container
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def _resolve(self, name: str) -> Any:
+        return self._providers[name]()
+
+    @cached_property
+    def problem_repo(self) -> IProblemRepository:
+        return self._resolve("problem_repo")
+
+    @cached_property
+    def user_repo(self) -> IUserRepository:
+        return self._resolve("user_repo")
+
+    @cached_property
+    def draft_repo(self) -> IDraftRepository:
+        return self._resolve("draft_repo")
+
+    @cached_property
+    def submission_repo(self) -> ISubmissionRepository:
+        return self._resolve("submission_repo")
+
+    @cached_property
+    def progress_repo(self) -> IProgressRepository:
+        return self._resolve("progress_repo")
+
+    @cached_property
+    def executor(self) -> ICodeExecutor:
+        return self._resolve("executor")
+
+    @cached_property
+    def auth(self) -> IAuthProvider:
+        return self._resolve("auth")
@@ -1,4 +1,10 @@
 """Factory functions for creating dependencies."""
+import sys
+from collections.abc import Callable, Mapping
+from functools import cache, lru_cache, partial
+from importlib import import_module
+from typing import Any, TypeVar
+
 from .config import Config, StorageConfig, ExecutorConfig, AuthConfig
 from .container import Container
 
@@ -12,6 +18,8 @@ from core.ports.repositories import (
 from core.ports.executors import ICodeExecutor
 from core.ports.auth import IAuthProvider
 
+T = TypeVar("T")
+
 
 def create_container(config: Config) -> Container:
     """
@@ -19,150 +27,174 @@ def create_container(config: Config) -> Container:
 
     This is the main factory function that assembles all
     dependencies based on the provided configuration.
+    Containers are cached per config: configs are frozen and
+    hashable, so equal configs share one Container instance.
+
+    Backend types are checked immediately, but each dependency
+    is constructed only when first accessed on the container.
 
     Args:
         config: Application configuration
 
     Returns:
-        Fully initialized Container with all dependencies
+        Container resolving all dependencies on demand
     """
-    # Create repositories
-    problem_repo = _create_problem_repo(config.storage)
-    user_repo = _create_user_repo(config.storage)
-    draft_repo = _create_draft_repo(config.storage)
-    submission_repo = _create_submission_repo(config.storage)
-    progress_repo = _create_progress_repo(config.storage)
-
-    # Create executor
-    executor = _create_executor(config.executor)
-
-    # Create auth provider
-    auth = _create_auth(config.auth)
-
-    return Container(
-        problem_repo=problem_repo,
-        user_repo=user_repo,
-        draft_repo=draft_repo,
-        submission_repo=submission_repo,
-        progress_repo=progress_repo,
-        executor=executor,
-        auth=auth,
+    return _create_container_cached(config)
+
+
+@lru_cache(maxsize=None)
+def _create_container_cached(config: Config) -> Container:
+    """Build a new container; memoized by create_container."""
+    storage_factories = _lookup(_REPO_FACTORIES, config.storage, "storage")
+    providers = {
+        name: partial(factory, config.storage)
+        for name, factory in storage_factories.items()
+    }
+    providers["executor"] = _resolve(_EXECUTOR_FACTORIES, config.executor, "executor")
+    providers["auth"] = _resolve(_AUTH_FACTORIES, config.auth, "auth")
+
+    return Container.from_providers(
+        providers,
         default_locale=config.app.default_locale,
         default_timeout_sec=config.executor.timeout_sec,
     )
 
 
+# ============================================================
+# Dispatch helpers
+# ============================================================
+
+_NOT_IMPLEMENTED = "{} not yet implemented"
+
+
+def _lookup(factories: Mapping[str, T | str], config: Any, kind: str) -> T:
+    """
+    Return the registry entry for ``config.type``.
+
+    String entries name backends that are planned but not implemented.
+    """
+    entry = factories.get(config.type)
+    if entry is None:
+        raise ValueError(f"Unknown {kind} type: {config.type}")
+    if isinstance(entry, str):
+        raise NotImplementedError(_NOT_IMPLEMENTED.format(entry))
+    return entry
+
+
+def _resolve(
+    factories: Mapping[str, Callable[[Any], T] | str],
+    config: Any,
+    kind: str,
+) -> Callable[[], T]:
+    """Bind the factory for ``config.type`` without calling it."""
+    return partial(_lookup(factories, config, kind), config)
+
+
+# ============================================================
+# Cached adapter imports
+# ============================================================
+
+# Adapters are imported on first use. Following Django's cached_import,
+# import_module is skipped when the module is already fully loaded;
+# @cache then makes later lookups a single dict hit.
+
+@cache
+def _cached_import(module_path: str, class_name: str) -> Any:
+    modules = sys.modules
+    if module_path not in modules or (
+        # Module is not fully initialized.
+        getattr(modules[module_path], "__spec__", None) is not None
+        and getattr(modules[module_path].__spec__, "_initializing", False) is True
+    ):
+        import_module(module_path)
+    return getattr(modules[module_path], class_name)
+
+
 # ============================================================
 # Repository Providers
 # ============================================================
 
-def _create_problem_repo(config: StorageConfig) -> IProblemRepository:
-    """Create problem repository based on storage type."""
-    match config.type:
-        case "json":
-            from adapters.storage.json_problem_repository import JsonProblemRepository
-            return JsonProblemRepository(config.json.base_path / "problems")
-        case "sqlite":
-            raise NotImplementedError("SQLite storage not yet implemented")
-        case "postgresql":
-            raise NotImplementedError("PostgreSQL storage not yet implemented")
-        case _:
-            raise ValueError(f"Unknown storage type: {config.type}")
-
-
-def _create_user_repo(config: StorageConfig) -> IUserRepository:
-    """Create user repository based on storage type."""
-    match config.type:
-        case "json":
-            from adapters.storage.json_user_repository import JsonUserRepository
-            return JsonUserRepository(config.json.base_path / "users")
-        case "sqlite":
-            raise NotImplementedError("SQLite storage not yet implemented")
-        case "postgresql":
-            raise NotImplementedError("PostgreSQL storage not yet implemented")
-        case _:
-            raise ValueError(f"Unknown storage type: {config.type}")
-
-
-def _create_draft_repo(config: StorageConfig) -> IDraftRepository:
-    """Create draft repository based on storage type."""
-    match config.type:
-        case "json":
-            from adapters.storage.json_draft_repository import JsonDraftRepository
-            return JsonDraftRepository(config.json.base_path / "drafts")
-        case "sqlite":
-            raise NotImplementedError("SQLite storage not yet implemented")
-        case "postgresql":
-            raise NotImplementedError("PostgreSQL storage not yet implemented")
-        case _:
-            raise ValueError(f"Unknown storage type: {config.type}")
-
-
-def _create_submission_repo(config: StorageConfig) -> ISubmissionRepository:
-    """Create submission repository based on storage type."""
-    match config.type:
-        case "json":
-            from adapters.storage.json_submission_repository import JsonSubmissionRepository
-            return JsonSubmissionRepository(config.json.base_path / "submissions")
-        case "sqlite":
-            raise NotImplementedError("SQLite storage not yet implemented")
-        case "postgresql":
-            raise NotImplementedError("PostgreSQL storage not yet implemented")
-        case _:
-            raise ValueError(f"Unknown storage type: {config.type}")
-
-
-def _create_progress_repo(config: StorageConfig) -> IProgressRepository:
-    """Create progress repository based on storage type."""
-    match config.type:
-        case "json":
-            from adapters.storage.json_progress_repository import JsonProgressRepository
-            return JsonProgressRepository(config.json.base_path / "progress")
-        case "sqlite":
-            raise NotImplementedError("SQLite storage not yet implemented")
-        case "postgresql":
-            raise NotImplementedError("PostgreSQL storage not yet implemented")
-        case _:
-            raise ValueError(f"Unknown storage type: {config.type}")
+def _json_problem_repo(config: StorageConfig) -> IProblemRepository:
+    repo_cls = _cached_import(
+        "adapters.storage.json_problem_repository", "JsonProblemRepository"
+    )
+    return repo_cls(config.json.base_path / "problems")
+
+
+def _json_user_repo(config: StorageConfig) -> IUserRepository:
+    repo_cls = _cached_import(
+        "adapters.storage.json_user_repository", "JsonUserRepository"
+    )
+    return repo_cls(config.json.base_path / "users")
+
+
+def _json_draft_repo(config: StorageConfig) -> IDraftRepository:
+    repo_cls = _cached_import(
+        "adapters.storage.json_draft_repository", "JsonDraftRepository"
+    )
+    return repo_cls(config.json.base_path / "drafts")
+
+
+def _json_submission_repo(config: StorageConfig) -> ISubmissionRepository:
+    repo_cls = _cached_import(
+        "adapters.storage.json_submission_repository", "JsonSubmissionRepository"
+    )
+    return repo_cls(config.json.base_path / "submissions")
+
+
+def _json_progress_repo(config: StorageConfig) -> IProgressRepository:
+    repo_cls = _cached_import(
+        "adapters.storage.json_progress_repository", "JsonProgressRepository"
+    )
+    return repo_cls(config.json.base_path / "progress")
+
+
+# Storage type -> dependency name -> factory
+_REPO_FACTORIES: dict[str, dict[str, Callable[[StorageConfig], Any]] | str] = {
+    "json": {
+        "problem_repo": _json_problem_repo,
+        "user_repo": _json_user_repo,
+        "draft_repo": _json_draft_repo,
+        "submission_repo": _json_submission_repo,
+        "progress_repo": _json_progress_repo,
+    },
+    "sqlite": "SQLite storage",
+    "postgresql": "PostgreSQL storage",
+}
 
 
 # ============================================================
 # Executor Providers
 # ============================================================
 
-def _create_executor(config: ExecutorConfig) -> ICodeExecutor:
-    """Create code executor based on type."""
-    match config.type:
-        case "local":
-            from adapters.executors.local_executor import (
-                LocalExecutor,
-                ExecutorConfig as ExecConfig,
-            )
-            return LocalExecutor(ExecConfig(
-                timeout_sec=config.timeout_sec,
-                memory_limit_mb=config.memory_limit_mb,
-            ))
-        case "docker":
-            raise NotImplementedError("Docker executor not yet implemented")
-        case "remote":
-            raise NotImplementedError("Remote executor not yet implemented")
-        case _:
-            raise ValueError(f"Unknown executor type: {config.type}")
+def _local_executor(config: ExecutorConfig) -> ICodeExecutor:
+    module = "adapters.executors.local_executor"
+    exec_config_cls = _cached_import(module, "ExecutorConfig")
+    return _cached_import(module, "LocalExecutor")(exec_config_cls(
+        timeout_sec=config.timeout_sec,
+        memory_limit_mb=config.memory_limit_mb,
+    ))
+
+
+_EXECUTOR_FACTORIES: dict[str, Callable[[ExecutorConfig], ICodeExecutor] | str] = {
+    "local": _local_executor,
+    "docker": "Docker executor",
+    "remote": "Remote executor",
+}
 
 
 # ============================================================
 # Auth Providers
 # ============================================================
 
-def _create_auth(config: AuthConfig) -> IAuthProvider:
-    """Create auth provider based on type."""
-    match config.type:
-        case "anonymous":
-            from adapters.auth.anonymous_auth import AnonymousAuthProvider
-            return AnonymousAuthProvider()
-        case "telegram":
-            raise NotImplementedError("Telegram auth not yet implemented")
-        case "token":
-            raise NotImplementedError("Token auth not yet implemented")
-        case _:
-            raise ValueError(f"Unknown auth type: {config.type}")
+def _anonymous_auth(config: AuthConfig) -> IAuthProvider:
+    auth_cls = _cached_import("adapters.auth.anonymous_auth", "AnonymousAuthProvider")
+    return auth_cls()
+
+
+_AUTH_FACTORIES: dict[str, Callable[[AuthConfig], IAuthProvider] | str] = {
+    "anonymous": _anonymous_auth,
+    "telegram": "Telegram auth",
+    "token": "Token auth",
+}
+
@@ -45,10 +45,33 @@ def temp_data_dir(temp_dir):
 
 
 # ============================================================
-# Domain Model Fixtures
+# Clock
 # ============================================================
 
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FIXED_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[override]
+        return FIXED_NOW
+
+
 @pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze datetime.now() where services and factories stamp times."""
+    for module in ("core.services.drafts", "core.domain.factories"):
+        monkeypatch.setattr(f"{module}.datetime", _FrozenDatetime)
+    return FIXED_NOW
+
+
+# ============================================================
+# Domain Model Fixtures
+# ============================================================
+
+@pytest.fixture(scope="session")
 def sample_problem():
     """Create a sample problem for testing."""
     return Problem(
@@ -79,8 +102,8 @@ def sample_problem():
                 description="answer not at start",
             ),
         ),
-        languages=(
-            LanguageSpec(
+        languages={
+            Language.PYTHON: LanguageSpec(
                 language=Language.PYTHON,
                 function_signature="def two_sum(nums: list[int], target: int) -> list[int]:",
                 solutions=(
@@ -97,18 +120,18 @@ def sample_problem():
                     ),
                 ),
             ),
-        ),
+        },
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user():
     """Create a sample user for testing."""
     return User(
         id="test_user_123",
         locale="en",
         preferred_language=Language.PYTHON,
-        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        created_at=FIXED_NOW,
     )
 
 
@@ -173,14 +196,16 @@ def problem_repo(temp_data_dir, sample_problem):
         ],
         "languages": {
             "python3": {
-                "function_signature": sample_problem.languages[0].function_signature,
+                "function_signature": (
+                    sample_problem.languages[Language.PYTHON].function_signature
+                ),
                 "solutions": [
                     {
                         "name": s.name,
                         "complexity": s.complexity,
                         "code": s.code,
                     }
-                    for s in sample_problem.languages[0].solutions
+                    for s in sample_problem.languages[Language.PYTHON].solutions
                 ],
             }
         },
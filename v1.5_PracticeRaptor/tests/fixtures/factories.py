@@ -53,13 +53,13 @@ def create_problem(
                 expected=2,
             ),
         ),
-        languages=(
-            LanguageSpec(
+        languages={
+            Language.PYTHON: LanguageSpec(
                 language=Language.PYTHON,
                 function_signature="def solution(x: int) -> int:",
                 solutions=solutions,
             ),
-        ),
+        },
     )
 
 
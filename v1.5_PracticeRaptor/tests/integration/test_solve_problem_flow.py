@@ -1,6 +1,4 @@
 """Integration tests for the complete problem-solving flow."""
-import pytest
-
 from core.services import (
     get_problem,
     validate_code_syntax,
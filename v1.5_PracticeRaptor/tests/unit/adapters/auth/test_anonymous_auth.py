@@ -1,6 +1,4 @@
 """Tests for anonymous authentication provider."""
-import pytest
-
 from adapters.auth.anonymous_auth import AnonymousAuthProvider
 from core.domain.enums import Language
 
@@ -35,6 +33,15 @@ class TestAnonymousAuthProvider:
 
         assert user.id.startswith("local_")
 
+    def test_repeated_calls_share_result(self) -> None:
+        """Repeated lookups return the same Ok instance."""
+        provider = AnonymousAuthProvider()
+
+        first = provider.get_current_user()
+
+        assert provider.get_current_user() is first
+        assert provider.authenticate({}) is first
+
     def test_custom_user_id(self) -> None:
         """Provider should use custom user ID if provided."""
         provider = AnonymousAuthProvider(user_id="custom_user_123")
@@ -1,4 +1,8 @@
 """Tests for LocalExecutor."""
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from adapters.executors.local_executor import LocalExecutor, ExecutorConfig
@@ -264,6 +268,31 @@ def add(a, b):
         assert result.is_ok()
         assert result.unwrap().success is True
 
+    def test_runs_tests_with_spawn_despite_global_fork(self) -> None:
+        """Test processes use spawn even if the global method is fork."""
+        project_root = Path(__file__).resolve().parents[4]
+        code = (
+            "import multiprocessing, sys\n"
+            "from multiprocessing.context import SpawnProcess\n"
+            "from adapters.executors.local_executor import LocalExecutor\n"
+            "from core.domain.models import TestCase\n"
+            "multiprocessing.set_start_method('fork')\n"
+            "started = []\n"
+            "start = SpawnProcess.start\n"
+            "SpawnProcess.start = lambda self: (started.append(1), start(self))\n"
+            "result = LocalExecutor().execute(\n"
+            "    code='def solution(x): return x * 2',\n"
+            "    test_cases=(TestCase(input={'x': 1}, expected=2),),\n"
+            "    function_name='solution',\n"
+            ")\n"
+            "sys.exit(not (result.is_ok() and started\n"
+            "              and multiprocessing.get_start_method() == 'fork'))\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root)
+
+        assert result.returncode == 0
+
 
 class TestFloatComparison:
     """Tests for float comparison with tolerance."""
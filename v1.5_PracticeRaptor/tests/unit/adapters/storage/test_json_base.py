@@ -1,6 +1,5 @@
 """Tests for JsonStorageBase."""
 import json
-import pytest
 from pathlib import Path
 from typing import Any
 
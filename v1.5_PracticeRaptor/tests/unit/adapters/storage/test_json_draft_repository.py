@@ -1,5 +1,4 @@
 """Tests for JsonDraftRepository."""
-import pytest
 from pathlib import Path
 from datetime import datetime
 
@@ -125,6 +125,19 @@ class TestJsonProblemRepository:
         assert problems[0].id == 1
         assert problems[1].id == 2
 
+    def test_get_all_reuses_sorted_tuple(
+        self, tmp_path: Path, sample_problem_json: dict
+    ) -> None:
+        """Test that get_all returns the same tuple until invalidated."""
+        (tmp_path / "1.json").write_text(json.dumps(sample_problem_json))
+        repo = JsonProblemRepository(tmp_path)
+
+        first = repo.get_all()
+
+        assert repo.get_all() is first
+        repo.invalidate_cache()
+        assert repo.get_all() is not first
+
     def test_filter_by_difficulty(
         self, tmp_path: Path, sample_problem_json: dict
     ) -> None:
@@ -170,6 +183,34 @@ class TestJsonProblemRepository:
         assert len(python_problems) == 1
         assert len(go_problems) == 0
 
+    def test_filter_combines_criteria(
+        self, tmp_path: Path, sample_problem_json: dict
+    ) -> None:
+        """Test that all given criteria must match."""
+        (tmp_path / "1.json").write_text(json.dumps(sample_problem_json))
+        medium_problem = sample_problem_json.copy()
+        medium_problem["id"] = 2
+        medium_problem["difficulty"] = "medium"
+        (tmp_path / "2.json").write_text(json.dumps(medium_problem))
+        repo = JsonProblemRepository(tmp_path)
+
+        problems = repo.filter(
+            difficulty=Difficulty.MEDIUM,
+            tags=("array",),
+            language=Language.PYTHON,
+        )
+
+        assert [p.id for p in problems] == [2]
+
+    def test_filter_without_criteria_returns_all(
+        self, tmp_path: Path, sample_problem_json: dict
+    ) -> None:
+        """Test that filter with no criteria returns every problem."""
+        (tmp_path / "1.json").write_text(json.dumps(sample_problem_json))
+        repo = JsonProblemRepository(tmp_path)
+
+        assert repo.filter() == repo.get_all()
+
     def test_count_returns_number_of_problems(
         self, tmp_path: Path, sample_problem_json: dict
     ) -> None:
@@ -1,5 +1,4 @@
 """Tests for JsonProgressRepository."""
-import pytest
 from pathlib import Path
 from datetime import datetime
 
@@ -1,5 +1,4 @@
 """Tests for JsonSubmissionRepository."""
-import pytest
 from pathlib import Path
 from datetime import datetime
 
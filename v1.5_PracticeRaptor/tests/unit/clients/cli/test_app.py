@@ -27,13 +27,13 @@ def sample_problems():
             tags=("array",),
             examples=(),
             test_cases=(),
-            languages=(
-                LanguageSpec(
+            languages={
+                Language.PYTHON: LanguageSpec(
                     language=Language.PYTHON,
                     function_signature="def two_sum(nums, target):",
                     solutions=(),
                 ),
-            ),
+            },
         ),
         Problem(
             id=2,
@@ -43,13 +43,13 @@ def sample_problems():
             tags=("string",),
             examples=(),
             test_cases=(),
-            languages=(
-                LanguageSpec(
+            languages={
+                Language.PYTHON: LanguageSpec(
                     language=Language.PYTHON,
                     function_signature="def reverse_string(s):",
                     solutions=(),
                 ),
-            ),
+            },
         ),
     )
 
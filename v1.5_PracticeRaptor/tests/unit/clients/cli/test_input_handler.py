@@ -28,8 +28,8 @@ def sample_problem():
         tags=(),
         examples=(),
         test_cases=(),
-        languages=(
-            LanguageSpec(
+        languages={
+            Language.PYTHON: LanguageSpec(
                 language=Language.PYTHON,
                 function_signature="def solution(x):",
                 solutions=(
@@ -40,10 +40,16 @@ def sample_problem():
                     ),
                 ),
             ),
-        ),
+        },
     )
 
 
+@pytest.fixture
+def solutions(sample_problem):
+    """Canonical solutions of the sample problem."""
+    return sample_problem.get_language_spec(Language.PYTHON).solutions
+
+
 class TestInputResult:
     """Tests for InputResult dataclass."""
 
@@ -107,30 +113,44 @@ class TestGetUserChoice:
 class TestReadUserCode:
     """Tests for read_user_code function."""
 
-    def test_reads_multiline_code(self, sample_problem):
+    @pytest.fixture(autouse=True)
+    def interactive_stdin(self):
+        """Treat stdin as a terminal so input() is used."""
+        with patch("sys.stdin.isatty", return_value=True):
+            yield
+
+    def test_reads_multiline_code(self, solutions):
         """Should read multiline code ending with double enter."""
         inputs = ["def foo():", "    return 1", "", ""]
         with patch("builtins.input", side_effect=inputs):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         assert result.code is not None
         assert "def foo():" in result.code
         assert "return 1" in result.code
         assert result.cancelled is False
 
-    def test_cancel_command(self, sample_problem):
+    def test_keeps_inner_blank_line(self, solutions):
+        """A single blank line inside code is preserved, trailing one is not."""
+        inputs = ["a = 1", "   ", "b = 2", "", ""]
+        with patch("builtins.input", side_effect=inputs):
+            result = read_user_code(solutions)
+
+        assert result.code == "a = 1\n\nb = 2"
+
+    def test_cancel_command(self, solutions):
         """!cancel should cancel input."""
         with patch("builtins.input", side_effect=["!cancel"]):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         assert result.cancelled is True
         assert result.code is None
 
-    def test_reset_command(self, sample_problem, capsys):
+    def test_reset_command(self, solutions, capsys):
         """!reset should clear code."""
         inputs = ["def foo():", "!reset", "def bar():", "", ""]
         with patch("builtins.input", side_effect=inputs):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         assert result.code is not None
         assert "def bar():" in result.code
@@ -138,31 +158,78 @@ class TestReadUserCode:
         captured = capsys.readouterr()
         assert "Code cleared" in captured.out
 
-    def test_hint_command(self, sample_problem, capsys):
+    def test_hint_command(self, solutions, capsys):
         """!hint should show hint."""
         inputs = ["!hint", "def solution(x): return x", "", ""]
         with patch("builtins.input", side_effect=inputs):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         captured = capsys.readouterr()
         assert "Simple" in captured.out or "Hint" in captured.out
 
-    def test_empty_input_is_cancelled(self, sample_problem):
+    def test_hint_command_runs_out(self, solutions, capsys):
+        """Repeated !hint reports when no hints are left."""
+        inputs = ["!HINT", "!hint", "!cancel"]
+        with patch("builtins.input", side_effect=inputs):
+            read_user_code(solutions)
+
+        captured = capsys.readouterr()
+        assert "No more hints" in captured.out
+
+    def test_empty_input_is_cancelled(self, solutions):
         """Empty input should be treated as cancelled."""
         with patch("builtins.input", side_effect=["", ""]):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         assert result.cancelled is True
 
-    def test_eof_ends_input(self, sample_problem):
+    def test_eof_ends_input(self, solutions):
         """EOF should end input."""
         with patch("builtins.input", side_effect=["def foo():", EOFError]):
-            result = read_user_code(sample_problem, Language.PYTHON)
+            result = read_user_code(solutions)
 
         assert result.code is not None
         assert "def foo():" in result.code
 
 
+class TestReadUserCodePiped:
+    """Tests for read_user_code with non-interactive stdin."""
+
+    def test_reads_code_without_input(self, solutions, capsys):
+        """Piped stdin is read directly, without prompts."""
+        piped = StringIO("def foo():\n    return 1\n\n\n")
+        with patch("sys.stdin", piped), patch("builtins.input") as mock_input:
+            result = read_user_code(solutions)
+
+        assert result.code == "def foo():\n    return 1"
+        mock_input.assert_not_called()
+        assert ">>> " not in capsys.readouterr().out
+
+    def test_leaves_remaining_input_unread(self, solutions):
+        """Lines after the double blank line stay in the stream."""
+        piped = StringIO("x = 1\n\n\ny\n")
+        with patch("sys.stdin", piped):
+            result = read_user_code(solutions)
+
+        assert result.code == "x = 1"
+        assert piped.readline() == "y\n"
+
+    def test_handles_commands(self, solutions):
+        """Commands work the same for piped input."""
+        piped = StringIO("a = 1\n!reset\nb = 2\n")
+        with patch("sys.stdin", piped):
+            result = read_user_code(solutions)
+
+        assert result.code == "b = 2"
+
+    def test_cancel_command(self, solutions):
+        """!cancel cancels piped input."""
+        with patch("sys.stdin", StringIO("!cancel\n")):
+            result = read_user_code(solutions)
+
+        assert result.cancelled is True
+
+
 class TestReadCodeFromFile:
     """Tests for read_code_from_file function."""
 
@@ -239,3 +306,28 @@ class TestAskRetry:
         """Empty input should return True."""
         with patch("builtins.input", return_value=""):
             assert ask_retry() is True
+
+
+class TestShowPreviousCode:
+    """Tests for previous code display."""
+
+    def test_shows_each_line(self, solutions, capsys):
+        """Every line of previous code is printed with a gutter."""
+        with patch("sys.stdin.isatty", return_value=True), \
+                patch("builtins.input", side_effect=["!cancel"]):
+            read_user_code(solutions, "a = 1\nb = 2")
+
+        out = capsys.readouterr().out
+        assert "Previous code:" in out
+        assert "| a = 1" in out
+        assert "| b = 2" in out
+
+    def test_handles_windows_line_endings(self, solutions, capsys):
+        """CRLF line endings do not leak carriage returns."""
+        with patch("sys.stdin.isatty", return_value=True), \
+                patch("builtins.input", side_effect=["!cancel"]):
+            read_user_code(solutions, "a = 1\r\nb = 2")
+
+        out = capsys.readouterr().out
+        assert "| a = 1\n" in out
+        assert "\r" not in out
@@ -37,8 +37,8 @@ def sample_problem():
         tags=("array", "hash-table"),
         examples=(),
         test_cases=(),
-        languages=(
-            LanguageSpec(
+        languages={
+            Language.PYTHON: LanguageSpec(
                 language=Language.PYTHON,
                 function_signature="def two_sum(nums, target):",
                 solutions=(
@@ -49,7 +49,7 @@ def sample_problem():
                     ),
                 ),
             ),
-        ),
+        },
     )
 
 
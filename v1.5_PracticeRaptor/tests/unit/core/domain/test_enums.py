@@ -17,6 +17,10 @@ class TestDifficulty:
         assert isinstance(Difficulty.EASY, str)
         assert Difficulty.EASY == "easy"
 
+    def test_str_is_value(self) -> None:
+        assert str(Difficulty.EASY) == "easy"
+        assert f"{Difficulty.HARD}" == "hard"
+
     def test_can_create_from_value(self) -> None:
         assert Difficulty("easy") == Difficulty.EASY
         assert Difficulty("medium") == Difficulty.MEDIUM
@@ -35,20 +35,18 @@ class TestCreateUser:
 
 
 class TestCreateDraft:
-    def test_creates_draft(self) -> None:
-        before = datetime.now()
+    def test_creates_draft(self, frozen_now: datetime) -> None:
         draft = create_draft(
             user_id="user123",
             problem_id=1,
             code="def solve(): pass",
         )
-        after = datetime.now()
 
         assert draft.user_id == "user123"
         assert draft.problem_id == 1
         assert draft.language == Language.PYTHON
         assert draft.code == "def solve(): pass"
-        assert before <= draft.updated_at <= after
+        assert draft.updated_at == frozen_now
 
     def test_creates_with_custom_language(self) -> None:
         draft = create_draft(
@@ -61,8 +59,7 @@ class TestCreateDraft:
 
 
 class TestCreateSubmission:
-    def test_creates_submission(self) -> None:
-        before = datetime.now()
+    def test_creates_submission(self, frozen_now: datetime) -> None:
         submission = create_submission(
             user_id="user123",
             problem_id=1,
@@ -70,14 +67,13 @@ class TestCreateSubmission:
             execution_time_ms=10,
             memory_used_kb=1024,
         )
-        after = datetime.now()
 
         assert submission.id is not None
         assert submission.user_id == "user123"
         assert submission.problem_id == 1
         assert submission.execution_time_ms == 10
         assert submission.memory_used_kb == 1024
-        assert before <= submission.created_at <= after
+        assert submission.created_at == frozen_now
 
     def test_generates_unique_ids(self) -> None:
         s1 = create_submission("u1", 1, "code", 10)
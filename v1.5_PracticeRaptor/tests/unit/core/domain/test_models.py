@@ -19,6 +19,15 @@ from core.domain.models import (
 from core.domain.enums import Difficulty, Language, ProgressStatus
 
 
+FIXED_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def simple_test_case() -> TestCase:
+    """Shared immutable test case for result objects."""
+    return TestCase(input={"x": 1}, expected=2)
+
+
 class TestLocalizedText:
     def test_get_returns_translation(self) -> None:
         text = LocalizedText({"en": "Hello", "ru": "Привет"})
@@ -110,7 +119,7 @@ class TestLanguageSpec:
 
 
 class TestProblem:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_problem(self) -> Problem:
         return Problem(
             id=1,
@@ -124,13 +133,13 @@ class TestProblem:
             test_cases=(
                 TestCase(input={"nums": [2, 7], "target": 9}, expected=[0, 1]),
             ),
-            languages=(
-                LanguageSpec(
+            languages={
+                Language.PYTHON: LanguageSpec(
                     language=Language.PYTHON,
                     function_signature="def two_sum(nums, target):",
                     solutions=(),
                 ),
-            ),
+            },
         )
 
     def test_get_language_spec_returns_spec(self, sample_problem: Problem) -> None:
@@ -142,6 +151,13 @@ class TestProblem:
         spec = sample_problem.get_language_spec(Language.GO)
         assert spec is None
 
+    def test_languages_mapping_is_read_only(self, sample_problem: Problem) -> None:
+        with pytest.raises(TypeError):
+            sample_problem.languages[Language.GO] = LanguageSpec(  # type: ignore[index]
+                language=Language.GO,
+                function_signature="func twoSum() {}",
+            )
+
     def test_defaults(self) -> None:
         problem = Problem(
             id=1,
@@ -153,6 +169,19 @@ class TestProblem:
         assert problem.examples == ()
         assert problem.hints == ()
 
+    def test_partitions_hidden_test_cases(self) -> None:
+        visible = TestCase(input={"x": 1}, expected=1)
+        hidden = TestCase(input={"x": 2}, expected=2, is_hidden=True)
+        problem = Problem(
+            id=1,
+            title=LocalizedText({"en": "Test"}),
+            description=LocalizedText({"en": "Desc"}),
+            difficulty=Difficulty.MEDIUM,
+            test_cases=(visible, hidden),
+        )
+        assert problem.visible_test_cases == (visible,)
+        assert problem.hidden_test_cases == (hidden,)
+
 
 class TestUser:
     def test_creation(self) -> None:
@@ -187,7 +216,7 @@ class TestDraft:
             problem_id=1,
             language=Language.PYTHON,
             code="def solve(): pass",
-            updated_at=datetime.now(),
+            updated_at=FIXED_TIME,
         )
         assert draft.user_id == "user123"
         assert draft.problem_id == 1
@@ -203,7 +232,7 @@ class TestSubmission:
             code="def solve(): return 42",
             execution_time_ms=10,
             memory_used_kb=1024,
-            created_at=datetime.now(),
+            created_at=FIXED_TIME,
         )
         assert submission.execution_time_ms == 10
         assert submission.memory_used_kb == 1024
@@ -217,7 +246,7 @@ class TestProgress:
             status=ProgressStatus.SOLVED,
             attempts=3,
             solved_languages=(Language.PYTHON, Language.GO),
-            first_solved_at=datetime.now(),
+            first_solved_at=FIXED_TIME,
         )
         assert progress.status == ProgressStatus.SOLVED
         assert len(progress.solved_languages) == 2
@@ -234,10 +263,9 @@ class TestProgress:
 
 
 class TestTestResult:
-    def test_passed(self) -> None:
-        tc = TestCase(input={"x": 1}, expected=2)
+    def test_passed(self, simple_test_case: TestCase) -> None:
         result = TestResult(
-            test_case=tc,
+            test_case=simple_test_case,
             passed=True,
             actual=2,
             execution_time_ms=5,
@@ -245,10 +273,9 @@ class TestTestResult:
         assert result.passed is True
         assert result.error_message is None
 
-    def test_failed(self) -> None:
-        tc = TestCase(input={"x": 1}, expected=2)
+    def test_failed(self, simple_test_case: TestCase) -> None:
         result = TestResult(
-            test_case=tc,
+            test_case=simple_test_case,
             passed=False,
             actual=3,
             error_message="Expected 2, got 3",
@@ -258,13 +285,12 @@ class TestTestResult:
 
 
 class TestExecutionResult:
-    def test_success(self) -> None:
-        tc = TestCase(input={"x": 1}, expected=2)
+    def test_success(self, simple_test_case: TestCase) -> None:
         result = ExecutionResult(
             success=True,
             test_results=(
-                TestResult(test_case=tc, passed=True),
-                TestResult(test_case=tc, passed=True),
+                TestResult(test_case=simple_test_case, passed=True),
+                TestResult(test_case=simple_test_case, passed=True),
             ),
             total_time_ms=10,
         )
@@ -272,13 +298,12 @@ class TestExecutionResult:
         assert result.passed_count == 2
         assert result.total_count == 2
 
-    def test_failure(self) -> None:
-        tc = TestCase(input={"x": 1}, expected=2)
+    def test_failure(self, simple_test_case: TestCase) -> None:
         result = ExecutionResult(
             success=False,
             test_results=(
-                TestResult(test_case=tc, passed=True),
-                TestResult(test_case=tc, passed=False),
+                TestResult(test_case=simple_test_case, passed=True),
+                TestResult(test_case=simple_test_case, passed=False),
             ),
             total_time_ms=10,
         )
@@ -292,24 +317,21 @@ class TestExecutionResult:
         assert result.total_count == 0
 
 
-class TestImmutability:
-    def test_problem_is_frozen(self) -> None:
-        problem = Problem(
+FROZEN_CASES = [
+    pytest.param(
+        lambda: Problem(
             id=1,
             title=LocalizedText({"en": "Test"}),
             description=LocalizedText({"en": "Desc"}),
             difficulty=Difficulty.EASY,
-        )
-        with pytest.raises(AttributeError):
-            problem.id = 2  # type: ignore
-
-    def test_user_is_frozen(self) -> None:
-        user = User(id="user123")
-        with pytest.raises(AttributeError):
-            user.locale = "ru"  # type: ignore
-
-    def test_submission_is_frozen(self) -> None:
-        submission = Submission(
+        ),
+        "id",
+        2,
+        id="problem",
+    ),
+    pytest.param(lambda: User(id="user123"), "locale", "ru", id="user"),
+    pytest.param(
+        lambda: Submission(
             id="sub123",
             user_id="user123",
             problem_id=1,
@@ -317,7 +339,24 @@ class TestImmutability:
             code="pass",
             execution_time_ms=10,
             memory_used_kb=1024,
-            created_at=datetime.now(),
-        )
+            created_at=FIXED_TIME,
+        ),
+        "code",
+        "new code",
+        id="submission",
+    ),
+]
+
+
+class TestImmutability:
+    @pytest.mark.parametrize("factory,attr,value", FROZEN_CASES)
+    def test_is_frozen(self, factory, attr, value) -> None:
+        obj = factory()
         with pytest.raises(AttributeError):
-            submission.code = "new code"  # type: ignore
+            setattr(obj, attr, value)
+
+    def test_models_have_no_instance_dict(self) -> None:
+        user = User(id="user123")
+        text = LocalizedText({"en": "Test"})
+        assert not hasattr(user, "__dict__")
+        assert not hasattr(text, "__dict__")
@@ -0,0 +1,34 @@
+"""Tests for the core.domain package namespace."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import core.domain
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package exports."""
+
+    @pytest.mark.parametrize("name", core.domain.__all__)
+    def test_exports_resolve(self, name: str) -> None:
+        """Every name in __all__ is reachable from the package."""
+        assert getattr(core.domain, name) is not None
+
+    def test_unknown_name_raises(self) -> None:
+        """Unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            core.domain.NoSuchThing
+
+    def test_import_enums_does_not_load_models(self) -> None:
+        """Importing one submodule leaves the others unloaded."""
+        project_root = Path(__file__).resolve().parents[4]
+        code = (
+            "import sys; from core.domain.enums import Difficulty; "
+            "sys.exit('core.domain.models' in sys.modules)"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root)
+
+        assert result.returncode == 0
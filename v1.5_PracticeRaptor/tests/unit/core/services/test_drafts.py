@@ -1,7 +1,6 @@
 """Tests for drafts service functions."""
-import pytest
 from datetime import datetime
-from unittest.mock import Mock
+from typing import Any, Callable
 
 from core.domain.models import Draft
 from core.domain.enums import Language
@@ -15,6 +14,48 @@ from core.services.drafts import (
 )
 
 
+# Results are immutable, so one instance serves every test
+_NOT_FOUND = Err(NotFoundError(entity="Draft", id="test"))
+_OK_NONE = Ok(None)
+
+
+class _Rec:
+    """Callable that records its calls and returns a fixed value."""
+
+    def __init__(self, ret: Any) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.ret = ret
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+class _DraftRepoStub:
+    """Minimal IDraftRepository double with injected methods."""
+
+    def __init__(
+        self,
+        get: Callable[..., Any] | None = None,
+        save: Callable[..., Any] | None = None,
+        delete: Callable[..., Any] | None = None,
+    ) -> None:
+        self.get = get
+        self.save = save
+        self.delete = delete
+
+
+class EchoSaveRepo:
+    """Draft repository whose save() echoes the draft back as Ok."""
+
+    def __init__(self) -> None:
+        self.last: Draft | None = None
+
+    def save(self, draft: Draft) -> Ok[Draft]:
+        self.last = draft
+        return Ok(draft)
+
+
 def make_draft(
     user_id: str = "user1",
     problem_id: int = 1,
@@ -28,7 +69,7 @@ def make_draft(
         problem_id=problem_id,
         language=language,
         code=code,
-        updated_at=updated_at or datetime.now(),
+        updated_at=updated_at or datetime(2024, 1, 1, 12, 0, 0),
     )
 
 
@@ -38,19 +79,17 @@ class TestGetDraft:
     def test_returns_draft_when_found(self) -> None:
         """Return draft when repository finds it."""
         draft = make_draft(code="def solution(x): return x * 2")
-        repo = Mock()
-        repo.get.return_value = Ok(draft)
+        repo = _DraftRepoStub(get=_Rec(Ok(draft)))
 
         result = get_draft("user1", 1, Language.PYTHON, repo)
 
         assert result.is_ok()
         assert result.unwrap() == draft
-        repo.get.assert_called_once_with("user1", 1, Language.PYTHON)
+        assert repo.get.calls == [(("user1", 1, Language.PYTHON), {})]
 
     def test_returns_error_when_not_found(self) -> None:
         """Return error when draft not found."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Draft", id="user1:1"))
+        repo = _DraftRepoStub(get=_Rec(_NOT_FOUND))
 
         result = get_draft("user1", 1, Language.PYTHON, repo)
 
@@ -59,12 +98,11 @@ class TestGetDraft:
 
     def test_handles_different_languages(self) -> None:
         """Handle different language parameters."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Draft", id="test"))
+        repo = _DraftRepoStub(get=_Rec(_NOT_FOUND))
 
         get_draft("user1", 1, Language.GO, repo)
 
-        repo.get.assert_called_once_with("user1", 1, Language.GO)
+        assert repo.get.calls == [(("user1", 1, Language.GO), {})]
 
 
 class TestSaveDraft:
@@ -72,8 +110,7 @@ class TestSaveDraft:
 
     def test_saves_draft_successfully(self) -> None:
         """Save draft and return it."""
-        repo = Mock()
-        repo.save.side_effect = lambda d: Ok(d)
+        repo = EchoSaveRepo()
 
         result = save_draft(
             user_id="user1",
@@ -84,7 +121,8 @@ class TestSaveDraft:
         )
 
         assert result.is_ok()
-        saved_draft = result.unwrap()
+        assert result.unwrap() is repo.last
+        saved_draft = repo.last
         assert saved_draft.user_id == "user1"
         assert saved_draft.problem_id == 1
         assert saved_draft.language == Language.PYTHON
@@ -92,25 +130,22 @@ class TestSaveDraft:
 
     def test_returns_storage_error(self) -> None:
         """Return error when storage fails."""
-        repo = Mock()
-        repo.save.return_value = Err(StorageError(message="Write failed", operation="write"))
+        error = StorageError(message="Write failed", operation="write")
+        repo = _DraftRepoStub(save=_Rec(Err(error)))
 
         result = save_draft("user1", 1, Language.PYTHON, "code", repo)
 
         assert result.is_err()
         assert isinstance(result.error, StorageError)
 
-    def test_sets_updated_at(self) -> None:
+    def test_sets_updated_at(self, frozen_now: datetime) -> None:
         """Set updated_at to current time."""
-        repo = Mock()
-        repo.save.side_effect = lambda d: Ok(d)
-        before = datetime.now()
+        repo = EchoSaveRepo()
 
         result = save_draft("user1", 1, Language.PYTHON, "code", repo)
 
-        after = datetime.now()
         assert result.is_ok()
-        assert before <= result.unwrap().updated_at <= after
+        assert repo.last.updated_at == frozen_now
 
 
 class TestDeleteDraft:
@@ -118,18 +153,16 @@ class TestDeleteDraft:
 
     def test_deletes_draft_successfully(self) -> None:
         """Delete draft and return None."""
-        repo = Mock()
-        repo.delete.return_value = Ok(None)
+        repo = _DraftRepoStub(delete=_Rec(_OK_NONE))
 
         result = delete_draft("user1", 1, Language.PYTHON, repo)
 
         assert result.is_ok()
-        repo.delete.assert_called_once_with("user1", 1, Language.PYTHON)
+        assert repo.delete.calls == [(("user1", 1, Language.PYTHON), {})]
 
     def test_returns_error_when_not_found(self) -> None:
         """Return error when draft to delete not found."""
-        repo = Mock()
-        repo.delete.return_value = Err(NotFoundError(entity="Draft", id="user1:1"))
+        repo = _DraftRepoStub(delete=_Rec(_NOT_FOUND))
 
         result = delete_draft("user1", 1, Language.PYTHON, repo)
 
@@ -144,8 +177,7 @@ class TestGetOrCreateCode:
         """Return code from existing draft."""
         existing_code = "def two_sum(nums, target):\n    # My solution\n    pass"
         draft = make_draft(code=existing_code)
-        repo = Mock()
-        repo.get.return_value = Ok(draft)
+        repo = _DraftRepoStub(get=_Rec(Ok(draft)))
 
         result = get_or_create_code(
             user_id="user1",
@@ -159,8 +191,7 @@ class TestGetOrCreateCode:
 
     def test_returns_template_when_no_draft(self) -> None:
         """Return template with signature when no draft exists."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Draft", id="test"))
+        repo = _DraftRepoStub(get=_Rec(_NOT_FOUND))
 
         result = get_or_create_code(
             user_id="user1",
@@ -174,8 +205,7 @@ class TestGetOrCreateCode:
 
     def test_template_uses_provided_signature(self) -> None:
         """Template uses the exact provided signature."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Draft", id="test"))
+        repo = _DraftRepoStub(get=_Rec(_NOT_FOUND))
 
         result = get_or_create_code(
             user_id="user1",
@@ -189,9 +219,8 @@ class TestGetOrCreateCode:
 
     def test_handles_different_languages(self) -> None:
         """Handle different languages when getting draft."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Draft", id="test"))
+        repo = _DraftRepoStub(get=_Rec(_NOT_FOUND))
 
         get_or_create_code("user1", 1, Language.GO, "func solve()", repo)
 
-        repo.get.assert_called_once_with("user1", 1, Language.GO)
+        assert repo.get.calls == [(("user1", 1, Language.GO), {})]
@@ -1,11 +1,9 @@
 """Tests for problems service functions."""
-import pytest
 from typing import Any
-from unittest.mock import Mock
 
 from core.domain.models import Problem, LocalizedText, Example
 from core.domain.enums import Difficulty, Language
-from core.domain.result import Ok, Err
+from core.domain.result import Ok, Err, Result
 from core.domain.errors import NotFoundError
 from core.services.problems import (
     get_problem,
@@ -17,6 +15,35 @@ from core.services.problems import (
 )
 
 
+class FakeProblemRepo:
+    """IProblemRepository stub returning fixed values and recording calls."""
+
+    def __init__(
+        self,
+        get_by_id: Result[Problem, NotFoundError] | None = None,
+        get_all: tuple[Problem, ...] = (),
+        filter: tuple[Problem, ...] = (),
+    ) -> None:
+        self._get_by_id = get_by_id
+        self._get_all = get_all
+        self._filter = filter
+        self.get_by_id_calls: list[int] = []
+        self.get_all_calls = 0
+        self.filter_calls: list[dict[str, Any]] = []
+
+    def get_by_id(self, problem_id: int) -> Result[Problem, NotFoundError] | None:
+        self.get_by_id_calls.append(problem_id)
+        return self._get_by_id
+
+    def get_all(self) -> tuple[Problem, ...]:
+        self.get_all_calls += 1
+        return self._get_all
+
+    def filter(self, **criteria: Any) -> tuple[Problem, ...]:
+        self.filter_calls.append(criteria)
+        return self._filter
+
+
 def make_problem(
     id: int,
     title: str = "Test Problem",
@@ -41,19 +68,17 @@ class TestGetProblem:
     def test_returns_problem_when_found(self) -> None:
         """Return problem when repository finds it."""
         problem = make_problem(1, "Two Sum")
-        repo = Mock()
-        repo.get_by_id.return_value = Ok(problem)
+        repo = FakeProblemRepo(get_by_id=Ok(problem))
 
         result = get_problem(1, repo)
 
         assert result.is_ok()
         assert result.unwrap() == problem
-        repo.get_by_id.assert_called_once_with(1)
+        assert repo.get_by_id_calls == [1]
 
     def test_returns_error_when_not_found(self) -> None:
         """Return error when problem not found."""
-        repo = Mock()
-        repo.get_by_id.return_value = Err(NotFoundError(entity="Problem", id=999))
+        repo = FakeProblemRepo(get_by_id=Err(NotFoundError(entity="Problem", id=999)))
 
         result = get_problem(999, repo)
 
@@ -71,18 +96,16 @@ class TestGetAllProblems:
             make_problem(2, "Problem 2"),
             make_problem(3, "Problem 3"),
         )
-        repo = Mock()
-        repo.get_all.return_value = problems
+        repo = FakeProblemRepo(get_all=problems)
 
         result = get_all_problems(repo)
 
         assert result == problems
-        repo.get_all.assert_called_once()
+        assert repo.get_all_calls == 1
 
     def test_returns_empty_tuple_when_no_problems(self) -> None:
         """Return empty tuple when no problems exist."""
-        repo = Mock()
-        repo.get_all.return_value = ()
+        repo = FakeProblemRepo(get_all=())
 
         result = get_all_problems(repo)
 
@@ -94,47 +117,43 @@ class TestFilterProblems:
 
     def test_filters_by_difficulty(self) -> None:
         """Filter problems by difficulty."""
-        repo = Mock()
-        repo.filter.return_value = (make_problem(1),)
+        repo = FakeProblemRepo(filter=(make_problem(1),))
 
         result = filter_problems(repo, difficulty=Difficulty.EASY)
 
-        repo.filter.assert_called_once_with(
+        assert repo.filter_calls == [dict(
             difficulty=Difficulty.EASY,
             tags=None,
             language=None,
-        )
+        )]
 
     def test_filters_by_tags(self) -> None:
         """Filter problems by tags."""
-        repo = Mock()
-        repo.filter.return_value = ()
+        repo = FakeProblemRepo(filter=())
 
         filter_problems(repo, tags=("array", "hash"))
 
-        repo.filter.assert_called_once_with(
+        assert repo.filter_calls == [dict(
             difficulty=None,
             tags=("array", "hash"),
             language=None,
-        )
+        )]
 
     def test_filters_by_language(self) -> None:
         """Filter problems by language."""
-        repo = Mock()
-        repo.filter.return_value = ()
+        repo = FakeProblemRepo(filter=())
 
         filter_problems(repo, language=Language.PYTHON)
 
-        repo.filter.assert_called_once_with(
+        assert repo.filter_calls == [dict(
             difficulty=None,
             tags=None,
             language=Language.PYTHON,
-        )
+        )]
 
     def test_filters_by_multiple_criteria(self) -> None:
         """Filter problems by multiple criteria."""
-        repo = Mock()
-        repo.filter.return_value = ()
+        repo = FakeProblemRepo(filter=())
 
         filter_problems(
             repo,
@@ -143,11 +162,11 @@ class TestFilterProblems:
             language=Language.PYTHON,
         )
 
-        repo.filter.assert_called_once_with(
+        assert repo.filter_calls == [dict(
             difficulty=Difficulty.MEDIUM,
             tags=("dp",),
             language=Language.PYTHON,
-        )
+        )]
 
 
 class TestGetRandomProblem:
@@ -159,8 +178,7 @@ class TestGetRandomProblem:
             make_problem(1, "Problem 1"),
             make_problem(2, "Problem 2"),
         )
-        repo = Mock()
-        repo.filter.return_value = problems
+        repo = FakeProblemRepo(filter=problems)
 
         result = get_random_problem(repo)
 
@@ -174,18 +192,36 @@ class TestGetRandomProblem:
             make_problem(2, "Problem 2"),
             make_problem(3, "Problem 3"),
         )
-        repo = Mock()
-        repo.filter.return_value = problems
+        repo = FakeProblemRepo(filter=problems)
 
         result = get_random_problem(repo, exclude_ids=(1, 2))
 
         assert result.is_ok()
         assert result.unwrap().id == 3
 
+    def test_accepts_set_and_generator_exclusions(self) -> None:
+        """Exclusions may be given as any iterable of IDs."""
+        problems = (make_problem(1), make_problem(2), make_problem(3))
+        repo = FakeProblemRepo(filter=problems)
+
+        from_set = get_random_problem(repo, exclude_ids={1, 3})
+        from_gen = get_random_problem(repo, exclude_ids=(i for i in (2, 3)))
+
+        assert from_set.unwrap().id == 2
+        assert from_gen.unwrap().id == 1
+
+    def test_never_returns_excluded_when_most_are_excluded(self) -> None:
+        """Fallback after failed random draws still honours exclusions."""
+        problems = tuple(make_problem(i) for i in range(1, 11))
+        repo = FakeProblemRepo(filter=problems)
+
+        for _ in range(50):
+            result = get_random_problem(repo, exclude_ids=tuple(range(1, 10)))
+            assert result.unwrap().id == 10
+
     def test_returns_error_when_no_matching_problems(self) -> None:
         """Return error when no problems match criteria."""
-        repo = Mock()
-        repo.filter.return_value = ()
+        repo = FakeProblemRepo(filter=())
 
         result = get_random_problem(repo)
 
@@ -195,8 +231,7 @@ class TestGetRandomProblem:
     def test_returns_error_when_all_excluded(self) -> None:
         """Return error when all matching problems are excluded."""
         problems = (make_problem(1), make_problem(2))
-        repo = Mock()
-        repo.filter.return_value = problems
+        repo = FakeProblemRepo(filter=problems)
 
         result = get_random_problem(repo, exclude_ids=(1, 2))
 
@@ -221,6 +256,13 @@ class TestGetProblemDisplayText:
         assert result["difficulty"] == "easy"
         assert result["tags"] == "array, hash"
 
+    def test_difficulty_formats_as_plain_text(self) -> None:
+        """Difficulty is a plain str that formats as its value."""
+        result = get_problem_display_text(make_problem(1, difficulty=Difficulty.HARD))
+
+        assert type(result["difficulty"]) is str
+        assert f"{result['difficulty']}" == "hard"
+
     def test_returns_localized_text(self) -> None:
         """Return text in specified locale."""
         problem = make_problem(1, title="Two Sum")
@@ -1,20 +1,49 @@
 """Tests for progress service functions."""
-import pytest
 from datetime import datetime
-from unittest.mock import Mock
+
+import pytest
 
 from core.domain.models import Progress
 from core.domain.enums import Difficulty, Language, ProgressStatus
-from core.domain.result import Ok, Err
+from core.domain.result import Ok, Err, Result
 from core.domain.errors import NotFoundError
 from core.services.progress import (
     get_user_progress,
     update_progress_on_attempt,
+    replay_attempts,
     calculate_user_stats,
     calculate_stats_by_difficulty,
+    calculate_all_stats,
 )
 
 
+FIXED_NOW = datetime(2024, 6, 1, 9, 30, 0)
+
+
+class FakeProgressRepo:
+    """IProgressRepository stub returning fixed values and recording calls."""
+
+    def __init__(
+        self,
+        get: Result[Progress, NotFoundError] | None = None,
+        get_all_for_user: tuple[Progress, ...] = (),
+    ) -> None:
+        self._get = get
+        self._get_all_for_user = get_all_for_user
+        self.get_calls: list[tuple[str, int]] = []
+        self.get_all_for_user_calls: list[str] = []
+
+    def get(
+        self, user_id: str, problem_id: int
+    ) -> Result[Progress, NotFoundError] | None:
+        self.get_calls.append((user_id, problem_id))
+        return self._get
+
+    def get_all_for_user(self, user_id: str) -> tuple[Progress, ...]:
+        self.get_all_for_user_calls.append(user_id)
+        return self._get_all_for_user
+
+
 def make_progress(
     user_id: str = "user1",
     problem_id: int = 1,
@@ -40,18 +69,16 @@ class TestGetUserProgress:
     def test_returns_existing_progress(self) -> None:
         """Return existing progress from repository."""
         progress = make_progress(status=ProgressStatus.IN_PROGRESS, attempts=3)
-        repo = Mock()
-        repo.get.return_value = Ok(progress)
+        repo = FakeProgressRepo(get=Ok(progress))
 
         result = get_user_progress("user1", 1, repo)
 
         assert result == progress
-        repo.get.assert_called_once_with("user1", 1)
+        assert repo.get_calls == [("user1", 1)]
 
     def test_returns_initial_progress_when_not_found(self) -> None:
         """Return initial progress when not found in repository."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Progress", id="user1:1"))
+        repo = FakeProgressRepo(get=Err(NotFoundError(entity="Progress", id="user1:1")))
 
         result = get_user_progress("user1", 1, repo)
 
@@ -63,128 +90,180 @@ class TestGetUserProgress:
 
     def test_initial_progress_has_no_solved_at(self) -> None:
         """Initial progress should have no first_solved_at."""
-        repo = Mock()
-        repo.get.return_value = Err(NotFoundError(entity="Progress", id="test"))
+        repo = FakeProgressRepo(get=Err(NotFoundError(entity="Progress", id="test")))
 
         result = get_user_progress("user1", 1, repo)
 
         assert result.first_solved_at is None
 
 
-class TestUpdateProgressOnAttempt:
-    """Tests for update_progress_on_attempt function."""
-
-    def test_increments_attempts_on_failure(self) -> None:
-        """Increment attempts when solution fails."""
-        progress = make_progress(attempts=2)
-
-        result = update_progress_on_attempt(progress, solved=False, language=Language.PYTHON)
-
-        assert result.attempts == 3
-
-    def test_increments_attempts_on_success(self) -> None:
-        """Increment attempts when solution succeeds."""
-        progress = make_progress(attempts=2)
-
-        result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
-
-        assert result.attempts == 3
-
-    def test_sets_in_progress_on_first_failure(self) -> None:
-        """Set status to IN_PROGRESS on first failed attempt."""
-        progress = make_progress(status=ProgressStatus.NOT_STARTED)
-
-        result = update_progress_on_attempt(progress, solved=False, language=Language.PYTHON)
-
-        assert result.status == ProgressStatus.IN_PROGRESS
-
-    def test_keeps_in_progress_on_subsequent_failures(self) -> None:
-        """Keep status as IN_PROGRESS on subsequent failures."""
-        progress = make_progress(status=ProgressStatus.IN_PROGRESS, attempts=5)
-
-        result = update_progress_on_attempt(progress, solved=False, language=Language.PYTHON)
-
-        assert result.status == ProgressStatus.IN_PROGRESS
-
-    def test_sets_solved_on_success(self) -> None:
-        """Set status to SOLVED on success."""
-        progress = make_progress(status=ProgressStatus.IN_PROGRESS)
-
-        result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
-
-        assert result.status == ProgressStatus.SOLVED
-
-    def test_adds_solved_language(self) -> None:
-        """Add language to solved_languages on success."""
-        progress = make_progress()
+EARLIER = datetime(2024, 1, 1, 12, 0, 0)
+PY_SOLVED = make_progress(
+    status=ProgressStatus.SOLVED,
+    attempts=1,
+    solved_languages=(Language.PYTHON,),
+    first_solved_at=EARLIER,
+)
 
-        result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
 
-        assert Language.PYTHON in result.solved_languages
+class TestUpdateProgressOnAttempt:
+    """Tests for update_progress_on_attempt function."""
 
-    def test_does_not_duplicate_solved_language(self) -> None:
-        """Do not duplicate language in solved_languages."""
-        progress = make_progress(
-            status=ProgressStatus.SOLVED,
-            solved_languages=(Language.PYTHON,),
+    @pytest.mark.parametrize(
+        "initial,solved,language,expected",
+        [
+            pytest.param(
+                make_progress(),
+                False,
+                Language.PYTHON,
+                make_progress(status=ProgressStatus.IN_PROGRESS, attempts=1),
+                id="first_failure_sets_in_progress",
+            ),
+            pytest.param(
+                make_progress(status=ProgressStatus.IN_PROGRESS, attempts=5),
+                False,
+                Language.PYTHON,
+                make_progress(status=ProgressStatus.IN_PROGRESS, attempts=6),
+                id="later_failure_keeps_in_progress",
+            ),
+            pytest.param(
+                make_progress(attempts=2),
+                True,
+                Language.PYTHON,
+                make_progress(
+                    status=ProgressStatus.SOLVED,
+                    attempts=3,
+                    solved_languages=(Language.PYTHON,),
+                    first_solved_at=FIXED_NOW,
+                ),
+                id="first_success_sets_solved",
+            ),
+            pytest.param(
+                make_progress(status=ProgressStatus.IN_PROGRESS, attempts=2),
+                True,
+                Language.PYTHON,
+                make_progress(
+                    status=ProgressStatus.SOLVED,
+                    attempts=3,
+                    solved_languages=(Language.PYTHON,),
+                    first_solved_at=FIXED_NOW,
+                ),
+                id="success_after_failures",
+            ),
+            pytest.param(
+                PY_SOLVED,
+                True,
+                Language.PYTHON,
+                make_progress(
+                    status=ProgressStatus.SOLVED,
+                    attempts=2,
+                    solved_languages=(Language.PYTHON,),
+                    first_solved_at=EARLIER,
+                ),
+                id="same_language_not_duplicated",
+            ),
+            pytest.param(
+                PY_SOLVED,
+                True,
+                Language.GO,
+                make_progress(
+                    status=ProgressStatus.SOLVED,
+                    attempts=2,
+                    solved_languages=(Language.PYTHON, Language.GO),
+                    first_solved_at=EARLIER,
+                ),
+                id="new_language_appended",
+            ),
+            pytest.param(
+                PY_SOLVED,
+                False,
+                Language.GO,
+                make_progress(
+                    status=ProgressStatus.SOLVED,
+                    attempts=2,
+                    solved_languages=(Language.PYTHON,),
+                    first_solved_at=EARLIER,
+                ),
+                id="failure_keeps_solved",
+            ),
+        ],
+    )
+    def test_transition(
+        self,
+        initial: Progress,
+        solved: bool,
+        language: Language,
+        expected: Progress,
+    ) -> None:
+        """Each attempt yields the expected next progress state."""
+        result = update_progress_on_attempt(
+            initial, solved=solved, language=language, now_fn=lambda: FIXED_NOW
         )
 
-        result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
+        assert result == expected
 
-        assert result.solved_languages.count(Language.PYTHON) == 1
+    def test_does_not_read_clock_when_already_solved(self) -> None:
+        """The clock is only consulted on the first success."""
+        calls: list[None] = []
+        progress = make_progress(first_solved_at=datetime(2024, 1, 1))
 
-    def test_adds_new_language_to_existing(self) -> None:
-        """Add new language to existing solved languages."""
-        progress = make_progress(
-            status=ProgressStatus.SOLVED,
-            solved_languages=(Language.PYTHON,),
-        )
+        def clock() -> datetime:
+            calls.append(None)
+            return FIXED_NOW
 
-        result = update_progress_on_attempt(progress, solved=True, language=Language.GO)
+        for solved in (True, False):
+            update_progress_on_attempt(
+                progress, solved=solved, language=Language.GO, now_fn=clock
+            )
 
-        assert Language.PYTHON in result.solved_languages
-        assert Language.GO in result.solved_languages
+        assert calls == []
 
-    def test_sets_first_solved_at_on_first_success(self) -> None:
-        """Set first_solved_at on first success."""
-        progress = make_progress()
+    def test_is_immutable(self) -> None:
+        """Original progress should not be modified."""
+        progress = make_progress(attempts=2)
 
         result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
 
-        assert result.first_solved_at is not None
+        assert progress.attempts == 2
+        assert result.attempts == 3
 
-    def test_preserves_first_solved_at_on_subsequent_success(self) -> None:
-        """Preserve first_solved_at on subsequent successes."""
-        original_time = datetime(2024, 1, 1, 12, 0, 0)
-        progress = make_progress(
-            status=ProgressStatus.SOLVED,
-            solved_languages=(Language.PYTHON,),
-            first_solved_at=original_time,
-        )
 
-        result = update_progress_on_attempt(progress, solved=True, language=Language.GO)
+class TestReplayAttempts:
+    """Tests for replay_attempts function."""
 
-        assert result.first_solved_at == original_time
+    def test_matches_sequential_updates(self) -> None:
+        """Replaying equals applying each attempt in turn."""
+        attempts = [
+            (False, Language.PYTHON),
+            (True, Language.PYTHON),
+            (False, Language.GO),
+            (True, Language.GO),
+            (True, Language.PYTHON),
+        ]
+        expected = make_progress()
+        for solved, language in attempts:
+            expected = update_progress_on_attempt(expected, solved, language)
 
-    def test_keeps_solved_status_on_failure(self) -> None:
-        """Keep SOLVED status even when new attempt fails."""
-        progress = make_progress(
-            status=ProgressStatus.SOLVED,
-            solved_languages=(Language.PYTHON,),
-        )
+        result = replay_attempts(make_progress(), attempts, now_fn=lambda: FIXED_NOW)
 
-        result = update_progress_on_attempt(progress, solved=False, language=Language.GO)
+        assert result.status == expected.status
+        assert result.attempts == expected.attempts
+        assert result.solved_languages == expected.solved_languages
+        assert result.first_solved_at == FIXED_NOW
 
-        assert result.status == ProgressStatus.SOLVED
+    def test_keeps_in_progress_without_success(self) -> None:
+        """Only failures leave the problem in progress."""
+        result = replay_attempts(make_progress(), [(False, Language.PYTHON)] * 3)
 
-    def test_is_immutable(self) -> None:
-        """Original progress should not be modified."""
-        progress = make_progress(attempts=2)
+        assert result.status == ProgressStatus.IN_PROGRESS
+        assert result.attempts == 3
+        assert result.solved_languages == ()
 
-        result = update_progress_on_attempt(progress, solved=True, language=Language.PYTHON)
+    def test_no_attempts_returns_same_progress(self) -> None:
+        """An empty replay leaves progress untouched."""
+        progress = make_progress(attempts=2)
 
-        assert progress.attempts == 2
-        assert result.attempts == 3
+        assert replay_attempts(progress, []) is progress
 
 
 class TestCalculateUserStats:
@@ -197,8 +276,7 @@ class TestCalculateUserStats:
             make_progress(problem_id=2, status=ProgressStatus.SOLVED, attempts=1),
             make_progress(problem_id=3, status=ProgressStatus.IN_PROGRESS, attempts=5),
         )
-        repo = Mock()
-        repo.get_all_for_user.return_value = all_progress
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
 
         result = calculate_user_stats("user1", repo)
 
@@ -211,8 +289,7 @@ class TestCalculateUserStats:
             make_progress(problem_id=2, status=ProgressStatus.IN_PROGRESS),
             make_progress(problem_id=3, status=ProgressStatus.IN_PROGRESS),
         )
-        repo = Mock()
-        repo.get_all_for_user.return_value = all_progress
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
 
         result = calculate_user_stats("user1", repo)
 
@@ -225,8 +302,7 @@ class TestCalculateUserStats:
             make_progress(problem_id=2, attempts=7),
             make_progress(problem_id=3, attempts=2),
         )
-        repo = Mock()
-        repo.get_all_for_user.return_value = all_progress
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
 
         result = calculate_user_stats("user1", repo)
 
@@ -234,8 +310,7 @@ class TestCalculateUserStats:
 
     def test_returns_zeros_for_no_progress(self) -> None:
         """Return zeros when no progress exists."""
-        repo = Mock()
-        repo.get_all_for_user.return_value = ()
+        repo = FakeProgressRepo(get_all_for_user=())
 
         result = calculate_user_stats("user1", repo)
 
@@ -259,8 +334,7 @@ class TestCalculateStatsByDifficulty:
             2: Difficulty.MEDIUM,
             3: Difficulty.EASY,
         }
-        repo = Mock()
-        repo.get_all_for_user.return_value = all_progress
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
 
         result = calculate_stats_by_difficulty("user1", repo, difficulties)
 
@@ -271,8 +345,7 @@ class TestCalculateStatsByDifficulty:
 
     def test_initializes_all_difficulties(self) -> None:
         """Initialize stats for all difficulties."""
-        repo = Mock()
-        repo.get_all_for_user.return_value = ()
+        repo = FakeProgressRepo(get_all_for_user=())
 
         result = calculate_stats_by_difficulty("user1", repo, {})
 
@@ -280,6 +353,17 @@ class TestCalculateStatsByDifficulty:
         assert Difficulty.MEDIUM in result
         assert Difficulty.HARD in result
 
+    def test_calls_do_not_share_counters(self) -> None:
+        """Each call starts from fresh zeroed counters."""
+        solved = make_progress(problem_id=1, status=ProgressStatus.SOLVED)
+        repo = FakeProgressRepo(get_all_for_user=(solved,))
+        difficulties = {1: Difficulty.EASY}
+
+        calculate_stats_by_difficulty("user1", repo, difficulties)
+        result = calculate_stats_by_difficulty("user1", repo, difficulties)
+
+        assert result[Difficulty.EASY] == {"solved": 1, "total": 1}
+
     def test_ignores_unknown_problem_ids(self) -> None:
         """Ignore progress for problems not in difficulties map."""
         all_progress = (
@@ -287,10 +371,37 @@ class TestCalculateStatsByDifficulty:
             make_progress(problem_id=999, status=ProgressStatus.SOLVED),
         )
         difficulties = {1: Difficulty.EASY}
-        repo = Mock()
-        repo.get_all_for_user.return_value = all_progress
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
 
         result = calculate_stats_by_difficulty("user1", repo, difficulties)
 
         assert result[Difficulty.EASY]["total"] == 1
         assert result[Difficulty.EASY]["solved"] == 1
+
+
+class TestCalculateAllStats:
+    """Tests for calculate_all_stats function."""
+
+    def test_matches_separate_calculations(self) -> None:
+        """Combined stats equal the two separate calculations."""
+        all_progress = (
+            make_progress(problem_id=1, status=ProgressStatus.SOLVED, attempts=2),
+            make_progress(problem_id=2, status=ProgressStatus.IN_PROGRESS, attempts=3),
+            make_progress(problem_id=3, status=ProgressStatus.SOLVED, attempts=1),
+        )
+        difficulties = {1: Difficulty.EASY, 2: Difficulty.HARD, 3: Difficulty.HARD}
+        repo = FakeProgressRepo(get_all_for_user=all_progress)
+
+        totals, by_difficulty = calculate_all_stats("user1", repo, difficulties)
+
+        assert totals == calculate_user_stats("user1", repo)
+        expected = calculate_stats_by_difficulty("user1", repo, difficulties)
+        assert by_difficulty == expected
+
+    def test_reads_progress_once(self) -> None:
+        """Fetch user progress from the repository a single time."""
+        repo = FakeProgressRepo(get_all_for_user=())
+
+        calculate_all_stats("user1", repo, {})
+
+        assert repo.get_all_for_user_calls == ["user1"]
@@ -1,10 +1,15 @@
 """Tests for DI configuration."""
+import json
+import subprocess
+import sys
 import pytest
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from di.config import (
     load_config,
+    clear_config_cache,
     Config,
     AppConfig,
     StorageConfig,
@@ -14,28 +19,7 @@ from di.config import (
 )
 
 
-class TestLoadConfig:
-    """Tests for load_config function."""
-
-    def test_returns_defaults_when_no_file(self) -> None:
-        """Return default config when no file specified."""
-        config = load_config(None)
-
-        assert config.app.name == "PracticeRaptor"
-        assert config.storage.type == "json"
-        assert config.executor.type == "local"
-        assert config.auth.type == "anonymous"
-
-    def test_returns_defaults_for_nonexistent_file(self) -> None:
-        """Return default config when file doesn't exist."""
-        config = load_config(Path("/nonexistent/config.yaml"))
-
-        assert config.app.name == "PracticeRaptor"
-        assert config.storage.type == "json"
-
-    def test_loads_from_yaml(self) -> None:
-        """Load config from YAML file."""
-        yaml_content = """
+FULL_YAML = """
 app:
   name: TestApp
   environment: testing
@@ -54,69 +38,13 @@ executor:
 auth:
   type: anonymous
 """
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.yaml', delete=False
-        ) as f:
-            f.write(yaml_content)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            config = load_config(path)
-
-            assert config.app.name == "TestApp"
-            assert config.app.environment == "testing"
-            assert config.app.default_locale == "ru"
-            assert config.storage.type == "json"
-            assert config.storage.json.base_path == Path("./test_data")
-            assert config.executor.timeout_sec == 10
-            assert config.executor.memory_limit_mb == 512
-        finally:
-            path.unlink()
 
-    def test_partial_yaml_uses_defaults(self) -> None:
-        """Partial YAML file uses defaults for missing values."""
-        yaml_content = """
+PARTIAL_YAML = """
 app:
   name: PartialApp
 """
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.yaml', delete=False
-        ) as f:
-            f.write(yaml_content)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            config = load_config(path)
-
-            assert config.app.name == "PartialApp"
-            assert config.app.environment == "development"
-            assert config.storage.type == "json"
-            assert config.executor.timeout_sec == 5
-        finally:
-            path.unlink()
-
-    def test_empty_yaml_uses_defaults(self) -> None:
-        """Empty YAML file uses all defaults."""
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.yaml', delete=False
-        ) as f:
-            f.write("")
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            config = load_config(path)
-
-            assert config.app.name == "PracticeRaptor"
-            assert config.storage.type == "json"
-        finally:
-            path.unlink()
-
-    def test_loads_postgresql_config(self) -> None:
-        """Load PostgreSQL configuration."""
-        yaml_content = """
+
+POSTGRES_YAML = """
 storage:
   type: postgresql
   postgresql:
@@ -126,56 +54,214 @@ storage:
     user: admin
     password: secret
 """
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.yaml', delete=False
-        ) as f:
-            f.write(yaml_content)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            config = load_config(path)
-
-            assert config.storage.type == "postgresql"
-            assert config.storage.postgresql.host == "db.example.com"
-            assert config.storage.postgresql.port == 5433
-            assert config.storage.postgresql.database == "practice_db"
-            assert config.storage.postgresql.user == "admin"
-            assert config.storage.postgresql.password == "secret"
-        finally:
-            path.unlink()
 
 
-class TestConfigImmutability:
-    """Tests for config immutability."""
+def _write(directory: Path, content: str) -> Path:
+    """Write a config.yaml with content into directory."""
+    path = directory / "config.yaml"
+    path.write_text(content)
+    return path
 
-    def test_config_is_frozen(self) -> None:
-        """Config should be immutable."""
-        config = Config()
 
-        with pytest.raises(AttributeError):
-            config.app = AppConfig(name="Changed")
+@lru_cache(maxsize=None)
+def _load_cfg(yaml_text: str) -> Config:
+    """Load a YAML payload once; Config is frozen so results are shared."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        return load_config(_write(Path(tmpdir), yaml_text))
 
-    def test_app_config_is_frozen(self) -> None:
-        """AppConfig should be immutable."""
-        config = AppConfig()
 
-        with pytest.raises(AttributeError):
-            config.name = "Changed"
+@pytest.fixture(scope="module")
+def postgres_config() -> Config:
+    """Config loaded from the PostgreSQL YAML payload."""
+    return _load_cfg(POSTGRES_YAML)
 
-    def test_storage_config_is_frozen(self) -> None:
-        """StorageConfig should be immutable."""
-        config = StorageConfig()
 
-        with pytest.raises(AttributeError):
-            config.type = "sqlite"
+class TestLoadConfig:
+    """Tests for load_config function."""
+
+    @pytest.mark.parametrize(
+        "make_path",
+        [
+            pytest.param(lambda tmp: None, id="no-file"),
+            pytest.param(
+                lambda tmp: Path("/nonexistent/config.yaml"), id="nonexistent-file",
+            ),
+            pytest.param(lambda tmp: _write(tmp, ""), id="empty-file"),
+        ],
+    )
+    def test_returns_defaults(self, tmp_path: Path, make_path) -> None:
+        """Missing, nonexistent or empty config falls back to defaults."""
+        config = load_config(make_path(tmp_path))
+
+        assert config.app.name == "PracticeRaptor"
+        assert config.storage.type == "json"
+        assert config.executor.type == "local"
+        assert config.auth.type == "anonymous"
+
+    def test_missing_file_returns_shared_default(self) -> None:
+        """Default config instance is shared between calls."""
+        assert load_config(None) is load_config(Path("/nonexistent/config.yaml"))
+
+    def test_null_sections_use_defaults(self, tmp_path: Path) -> None:
+        """Sections set to null in YAML fall back to defaults."""
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\nstorage:\n  json:\n")
+
+        config = load_config(path)
+
+        assert config.app.name == "PracticeRaptor"
+        assert config.storage.json.base_path == Path("./data")
+
+    def test_loads_from_yaml(self) -> None:
+        """Load config from YAML file."""
+        config = _load_cfg(FULL_YAML)
+
+        assert config.app.name == "TestApp"
+        assert config.app.environment == "testing"
+        assert config.app.default_locale == "ru"
+        assert config.storage.type == "json"
+        assert config.storage.json.base_path == Path("./test_data")
+        assert config.executor.timeout_sec == 10
+        assert config.executor.memory_limit_mb == 512
+
+    def test_partial_yaml_uses_defaults(self) -> None:
+        """Partial YAML file uses defaults for missing values."""
+        config = _load_cfg(PARTIAL_YAML)
+
+        assert config.app.name == "PartialApp"
+        assert config.app.environment == "development"
+        assert config.storage.type == "json"
+        assert config.executor.timeout_sec == 5
+
+    def test_loads_postgresql_config(self, postgres_config: Config) -> None:
+        """Load PostgreSQL configuration."""
+        assert postgres_config.storage.type == "postgresql"
+        assert postgres_config.storage.postgresql.host == "db.example.com"
+        assert postgres_config.storage.postgresql.port == 5433
+        assert postgres_config.storage.postgresql.database == "practice_db"
+        assert postgres_config.storage.postgresql.user == "admin"
+        assert postgres_config.storage.postgresql.password == "secret"
+
+
+class TestConfigImport:
+    """Tests for import-time cost of the config module."""
+
+    def test_import_does_not_load_yaml(self) -> None:
+        """Importing di.config leaves PyYAML unloaded until a file is parsed."""
+        project_root = Path(__file__).resolve().parents[3]
+        code = "import sys, di.config; sys.exit('yaml' in sys.modules)"
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root)
+
+        assert result.returncode == 0
+
+
+class TestLoadConfigCache:
+    """Tests for load_config caching."""
+
+    def test_returns_cached_config_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Unchanged file returns the same Config instance."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: CachedApp\n")
+
+        first = load_config(path)
+        second = load_config(path)
+
+        assert first is second
+        assert first.app.name == "CachedApp"
+
+    def test_reloads_when_file_changes(self, tmp_path: Path) -> None:
+        """Modified file is parsed again."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: Before\n")
+        first = load_config(path)
+
+        path.write_text("app:\n  name: AfterChange\n")
+        second = load_config(path)
+
+        assert first.app.name == "Before"
+        assert second.app.name == "AfterChange"
 
-    def test_executor_config_is_frozen(self) -> None:
-        """ExecutorConfig should be immutable."""
-        config = ExecutorConfig()
+
+class TestLoadConfigSidecar:
+    """Tests for the JSON sidecar cache."""
+
+    def test_writes_sidecar_after_parse(self, tmp_path: Path) -> None:
+        """Parsing YAML writes a JSON sidecar next to it."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: SidecarApp\n")
+
+        load_config(path)
+
+        sidecar = json.loads((tmp_path / "config.yaml.json").read_text())
+        assert sidecar["data"] == {"app": {"name": "SidecarApp"}}
+
+    def test_uses_sidecar_matching_yaml(self, tmp_path: Path) -> None:
+        """Sidecar stamped with the current YAML stat is used instead of YAML."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: FromYaml\n")
+        load_config(path)
+
+        sidecar_path = tmp_path / "config.yaml.json"
+        sidecar = json.loads(sidecar_path.read_text())
+        sidecar["data"]["app"]["name"] = "FromSidecar"
+        sidecar_path.write_text(json.dumps(sidecar))
+        clear_config_cache()
+
+        assert load_config(path).app.name == "FromSidecar"
+
+    def test_ignores_stale_sidecar(self, tmp_path: Path) -> None:
+        """Sidecar written for an older YAML version is ignored."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: Old\n")
+        load_config(path)
+
+        path.write_text("app:\n  name: Newer\n")
+        clear_config_cache()
+
+        assert load_config(path).app.name == "Newer"
+
+    def test_ignores_corrupt_sidecar(self, tmp_path: Path) -> None:
+        """Invalid JSON sidecar falls back to YAML."""
+        clear_config_cache()
+        path = tmp_path / "config.yaml"
+        path.write_text("app:\n  name: Fallback\n")
+        (tmp_path / "config.yaml.json").write_text("{not json")
+
+        assert load_config(path).app.name == "Fallback"
+
+
+FROZEN_CASES = [
+    pytest.param(Config, "app", AppConfig(name="Changed"), id="config"),
+    pytest.param(AppConfig, "name", "Changed", id="app"),
+    pytest.param(StorageConfig, "type", "sqlite", id="storage"),
+    pytest.param(ExecutorConfig, "timeout_sec", 100, id="executor"),
+]
+
+
+class TestConfigImmutability:
+    """Tests for config immutability."""
+
+    @pytest.mark.parametrize("factory,attr,value", FROZEN_CASES)
+    def test_is_frozen(self, factory, attr, value) -> None:
+        """Config objects should be immutable."""
+        config = factory()
 
         with pytest.raises(AttributeError):
-            config.timeout_sec = 100
+            setattr(config, attr, value)
+
+    @pytest.mark.parametrize("factory,attr,value", FROZEN_CASES)
+    def test_uses_slots(self, factory, attr, value) -> None:
+        """Config objects are slotted and hashable."""
+        config = factory()
+
+        assert not hasattr(config, "__dict__")
+        assert hash(config) == hash(factory())
 
 
 class TestConfigDefaults:
@@ -1,24 +1,32 @@
 """Tests for DI container."""
+from typing import Any
+
 import pytest
 from unittest.mock import MagicMock
 
 from di.container import Container
 
 
+@pytest.fixture(scope="session")
+def mock_deps() -> dict[str, Any]:
+    """Placeholder dependencies shared by tests that never touch them."""
+    return dict(
+        problem_repo=MagicMock(),
+        user_repo=MagicMock(),
+        draft_repo=MagicMock(),
+        submission_repo=MagicMock(),
+        progress_repo=MagicMock(),
+        executor=MagicMock(),
+        auth=MagicMock(),
+    )
+
+
 class TestContainer:
     """Tests for Container class."""
 
-    def test_is_frozen(self) -> None:
+    def test_is_frozen(self, mock_deps: dict[str, Any]) -> None:
         """Container should be immutable."""
-        container = Container(
-            problem_repo=MagicMock(),
-            user_repo=MagicMock(),
-            draft_repo=MagicMock(),
-            submission_repo=MagicMock(),
-            progress_repo=MagicMock(),
-            executor=MagicMock(),
-            auth=MagicMock(),
-        )
+        container = Container(**mock_deps)
 
         with pytest.raises(AttributeError):
             container.problem_repo = MagicMock()
@@ -51,60 +59,64 @@ class TestContainer:
         assert container.executor is executor
         assert container.auth is auth
 
-    def test_default_locale(self) -> None:
+    def test_default_locale(self, mock_deps: dict[str, Any]) -> None:
         """Container has default locale."""
-        container = Container(
-            problem_repo=MagicMock(),
-            user_repo=MagicMock(),
-            draft_repo=MagicMock(),
-            submission_repo=MagicMock(),
-            progress_repo=MagicMock(),
-            executor=MagicMock(),
-            auth=MagicMock(),
-        )
+        container = Container(**mock_deps)
 
         assert container.default_locale == "en"
 
-    def test_custom_locale(self) -> None:
+    def test_custom_locale(self, mock_deps: dict[str, Any]) -> None:
         """Container accepts custom locale."""
-        container = Container(
-            problem_repo=MagicMock(),
-            user_repo=MagicMock(),
-            draft_repo=MagicMock(),
-            submission_repo=MagicMock(),
-            progress_repo=MagicMock(),
-            executor=MagicMock(),
-            auth=MagicMock(),
-            default_locale="ru",
-        )
+        container = Container(**mock_deps, default_locale="ru")
 
         assert container.default_locale == "ru"
 
-    def test_default_timeout(self) -> None:
+    def test_default_timeout(self, mock_deps: dict[str, Any]) -> None:
         """Container has default timeout."""
-        container = Container(
-            problem_repo=MagicMock(),
-            user_repo=MagicMock(),
-            draft_repo=MagicMock(),
-            submission_repo=MagicMock(),
-            progress_repo=MagicMock(),
-            executor=MagicMock(),
-            auth=MagicMock(),
-        )
+        container = Container(**mock_deps)
 
         assert container.default_timeout_sec == 5
 
-    def test_custom_timeout(self) -> None:
+    def test_custom_timeout(self, mock_deps: dict[str, Any]) -> None:
         """Container accepts custom timeout."""
-        container = Container(
-            problem_repo=MagicMock(),
-            user_repo=MagicMock(),
-            draft_repo=MagicMock(),
-            submission_repo=MagicMock(),
-            progress_repo=MagicMock(),
-            executor=MagicMock(),
-            auth=MagicMock(),
-            default_timeout_sec=10,
-        )
+        container = Container(**mock_deps, default_timeout_sec=10)
 
         assert container.default_timeout_sec == 10
+
+
+def mock_providers(deps: dict[str, Any]) -> dict[str, MagicMock]:
+    """Create one mock provider per dependency, returning that dependency."""
+    return {name: MagicMock(return_value=dep) for name, dep in deps.items()}
+
+
+class TestContainerFromProviders:
+    """Tests for lazily resolved containers."""
+
+    def test_does_not_call_providers_upfront(self, mock_deps: dict[str, Any]) -> None:
+        """Providers are not called when the container is created."""
+        providers = mock_providers(mock_deps)
+
+        Container.from_providers(providers)
+
+        for provider in providers.values():
+            provider.assert_not_called()
+
+    def test_resolves_once_on_first_access(self, mock_deps: dict[str, Any]) -> None:
+        """Each dependency is built on first access and then reused."""
+        providers = mock_providers(mock_deps)
+        container = Container.from_providers(providers)
+
+        assert container.problem_repo is mock_deps["problem_repo"]
+        assert container.problem_repo is mock_deps["problem_repo"]
+
+        providers["problem_repo"].assert_called_once_with()
+        providers["executor"].assert_not_called()
+
+    def test_is_frozen(self, mock_deps: dict[str, Any]) -> None:
+        """Lazy container is immutable as well."""
+        providers = mock_providers(mock_deps)
+        container = Container.from_providers(providers, default_locale="ru")
+
+        with pytest.raises(AttributeError):
+            container.executor = MagicMock()
+        assert container.default_locale == "ru"
@@ -1,4 +1,7 @@
 """Tests for DI providers."""
+import subprocess
+import sys
+
 import pytest
 import tempfile
 from pathlib import Path
@@ -11,7 +14,7 @@ from di.config import (
     AuthConfig,
     JsonStorageConfig,
 )
-from di.providers import create_container
+from di.providers import _cached_import, create_container
 from adapters.storage.json_problem_repository import JsonProblemRepository
 from adapters.storage.json_user_repository import JsonUserRepository
 from adapters.storage.json_draft_repository import JsonDraftRepository
@@ -139,34 +142,96 @@ class TestCreateContainer:
             with pytest.raises(ValueError, match="Unknown auth type"):
                 create_container(config)
 
-    def test_sqlite_not_implemented(self) -> None:
-        """SQLite storage raises NotImplementedError."""
-        config = Config(
-            storage=StorageConfig(type="sqlite"),
-        )
-
-        with pytest.raises(NotImplementedError, match="SQLite"):
+    @pytest.mark.parametrize(
+        "config,match",
+        [
+            pytest.param(
+                Config(storage=StorageConfig(type="sqlite")), "SQLite", id="sqlite"
+            ),
+            pytest.param(
+                Config(storage=StorageConfig(type="postgresql")),
+                "PostgreSQL",
+                id="postgresql",
+            ),
+            pytest.param(
+                Config(executor=ExecutorConfig(type="docker")), "Docker", id="docker"
+            ),
+            pytest.param(
+                Config(executor=ExecutorConfig(type="remote")), "Remote", id="remote"
+            ),
+            pytest.param(
+                Config(auth=AuthConfig(type="telegram")), "Telegram", id="telegram"
+            ),
+            pytest.param(
+                Config(auth=AuthConfig(type="token")), "Token", id="token"
+            ),
+        ],
+    )
+    def test_planned_backend_not_implemented(self, config: Config, match: str) -> None:
+        """Planned but unimplemented backends raise NotImplementedError."""
+        with pytest.raises(NotImplementedError, match=match):
             create_container(config)
 
-    def test_postgresql_not_implemented(self) -> None:
-        """PostgreSQL storage raises NotImplementedError."""
-        config = Config(
-            storage=StorageConfig(type="postgresql"),
-        )
+    def test_reuses_container_for_equal_config(self) -> None:
+        """Equal configs share one cached container."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def make_config() -> Config:
+                return Config(
+                    storage=StorageConfig(
+                        type="json",
+                        json=JsonStorageConfig(base_path=Path(tmpdir)),
+                    ),
+                )
 
-        with pytest.raises(NotImplementedError, match="PostgreSQL"):
-            create_container(config)
+            first = create_container(make_config())
+            second = create_container(make_config())
 
-    def test_docker_executor_not_implemented(self) -> None:
-        """Docker executor raises NotImplementedError."""
+            assert first is second
+
+    def test_builds_new_container_for_different_config(self) -> None:
+        """Different configs get separate containers."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(
-                storage=StorageConfig(
-                    type="json",
-                    json=JsonStorageConfig(base_path=Path(tmpdir)),
-                ),
-                executor=ExecutorConfig(type="docker"),
+            storage = StorageConfig(
+                type="json",
+                json=JsonStorageConfig(base_path=Path(tmpdir)),
             )
 
-            with pytest.raises(NotImplementedError, match="Docker"):
-                create_container(config)
+            first = create_container(Config(storage=storage))
+            second = create_container(
+                Config(storage=storage, executor=ExecutorConfig(timeout_sec=15))
+            )
+
+            assert first is not second
+
+
+class TestProvidersImport:
+    """Tests for import-time cost of the providers module."""
+
+    def test_import_does_not_load_adapters(self) -> None:
+        """Adapters are imported only when a container builds them."""
+        project_root = Path(__file__).resolve().parents[3]
+        code = (
+            "import sys, di.providers; "
+            "sys.exit(any(m.startswith('adapters') for m in sys.modules))"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root)
+
+        assert result.returncode == 0
+
+
+class TestCachedImport:
+    """Tests for the adapter import helper."""
+
+    def test_returns_loaded_class(self) -> None:
+        """An already imported module yields its class object."""
+        cls = _cached_import(
+            "adapters.storage.json_problem_repository", "JsonProblemRepository"
+        )
+
+        assert cls is JsonProblemRepository
+
+    def test_missing_attribute_raises(self) -> None:
+        """Unknown class names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _cached_import("adapters.storage.json_problem_repository", "Missing")
@@ -17,6 +17,7 @@ from .enums import (
     Complexity,
     Difficulty,
     Language,
+    LocalizedKind,
     ProgrammingLanguage,
     ProblemStatus,
     ExecutionStatus,
@@ -24,14 +25,8 @@ from .enums import (
 )
 
 # Localized content
-from .localization import (
-    Description,
-    Editorial,
-    Explanation,
-    Hint,
-    Tag,
-    Title,
-)
+from .localization import LocalizedText, Tag
+from .localization_store import LocalizationStore
 
 # Problem-related
 from .problem import (
@@ -39,6 +34,9 @@ from .problem import (
     Problem,
     ProblemDescription,
     ProblemSelector,
+    has_lang,
+    lang_mask,
+    make_problem,
 )
 
 # User management
@@ -79,22 +77,23 @@ __all__ = [
     "Complexity",
     "Difficulty",
     "Language",
+    "LocalizedKind",
     "ProgrammingLanguage",
     "ProblemStatus",
     "ExecutionStatus",
     "TextEditor",
     # Localized content
-    "Description",
-    "Editorial",
-    "Explanation",
-    "Hint",
+    "LocalizationStore",
+    "LocalizedText",
     "Tag",
-    "Title",
     # Problem-related
     "Example",
     "Problem",
     "ProblemDescription",
     "ProblemSelector",
+    "has_lang",
+    "lang_mask",
+    "make_problem",
     # User management
     "DEFAULT_SETTINGS",
     "DEFAULT_USER",
@@ -0,0 +1,17 @@
+"""Helpers for frozen records with derived slots."""
+
+from dataclasses import fields
+from typing import Any
+
+# Frozen records set their derived slots in __post_init__ through this.
+_set = object.__setattr__
+
+
+def _reduce_init_fields(self: Any) -> tuple[type, tuple[Any, ...]]:
+    """Pickle a record as a call to its constructor.
+
+    Used as ``__reduce__`` by records with derived slots (such as a
+    cached hash), so that unpickling recomputes them: str hashes are
+    randomized per process, so a pickled hash would be stale.
+    """
+    return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
@@ -1,23 +1,33 @@
 """Domain enumerations for PracticeRaptor v1.6."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class Language(str, Enum):
+class Language(StrEnum):
     """Supported interface languages (i18n)."""
 
     EN = "en"
     RU = "ru"
 
 
-class ProgrammingLanguage(str, Enum):
+class LocalizedKind(StrEnum):
+    """Kind of localized text record."""
+
+    TITLE = "title"
+    DESCRIPTION = "description"
+    EDITORIAL = "editorial"
+    EXPLANATION = "explanation"
+    HINT = "hint"
+
+
+class ProgrammingLanguage(StrEnum):
     """Supported programming languages for code execution."""
 
     PYTHON = "python3"
     JAVA = "java"
 
 
-class TextEditor(str, Enum):
+class TextEditor(StrEnum):
     """Supported text editors for CLI."""
 
     DEFAULT = "default"
@@ -25,7 +35,7 @@ class TextEditor(str, Enum):
     VIM = "vim"
 
 
-class Difficulty(str, Enum):
+class Difficulty(StrEnum):
     """Problem difficulty levels."""
 
     EASY = "easy"
@@ -33,7 +43,7 @@ class Difficulty(str, Enum):
     HARD = "hard"
 
 
-class Category(str, Enum):
+class Category(StrEnum):
     """Problem categories (algorithmic topics)."""
 
     ARRAY = "Array"
@@ -55,7 +65,7 @@ class Category(str, Enum):
     HEAP = "Heap"
 
 
-class Complexity(str, Enum):
+class Complexity(StrEnum):
     """Algorithmic complexity (Big O notation)."""
 
     O_1 = "O(1)"
@@ -68,7 +78,7 @@ class Complexity(str, Enum):
     O_N_FACTORIAL = "O(n!)"
 
 
-class ProblemStatus(str, Enum):
+class ProblemStatus(StrEnum):
     """User progress status on a problem."""
 
     NOT_STARTED = "not_started"
@@ -76,7 +86,7 @@ class ProblemStatus(str, Enum):
     SOLVED = "solved"
 
 
-class ExecutionStatus(str, Enum):
+class ExecutionStatus(StrEnum):
     """Status of code execution result."""
 
     ACCEPTED = "accepted"
@@ -1,13 +1,17 @@
 """Execution-related domain models."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+from ._frozen import _set
 from .enums import ExecutionStatus
 from .solution import Solution, TestCase
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TestResult:
     """Result of executing a single test case."""
 
@@ -18,7 +22,7 @@ class TestResult:
     test_memory_used_kb: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Execution:
     """Result of executing solution against test cases.
 
@@ -37,25 +41,23 @@ class Execution:
     error_message: str | None = None
     result: ExecutionStatus = ExecutionStatus.ACCEPTED
 
-    @property
-    def passed_count(self) -> int:
-        """Count of passed tests."""
-        return sum(
-            1 for r in self.test_results if r.result == ExecutionStatus.ACCEPTED
-        )
+    # Derived from test_results once in __post_init__ (the tuple is frozen too)
+    passed_count: int = field(init=False, repr=False, compare=False)
+    total_count: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def total_count(self) -> int:
-        """Total number of tests run."""
-        return len(self.test_results)
+    def __post_init__(self) -> None:
+        _set(self, "passed_count", sum(
+            1 for r in self.test_results if r.result is ExecutionStatus.ACCEPTED
+        ))
+        _set(self, "total_count", len(self.test_results))
 
     @property
     def is_accepted(self) -> bool:
         """Check if all tests passed."""
-        return self.result == ExecutionStatus.ACCEPTED
+        return self.result is ExecutionStatus.ACCEPTED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Submission:
     """Submission record (any execution result).
 
@@ -64,5 +66,5 @@ class Submission:
     """
 
     submission_id: int
-    created_at: datetime
+    created_at: "datetime"
     execution: Execution
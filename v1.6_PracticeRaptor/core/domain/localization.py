@@ -5,63 +5,50 @@ All multilingual content is stored as separate records
 This enables efficient database queries by language.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
-from .enums import Language
+from ._frozen import _reduce_init_fields, _set
+from .enums import Language, LocalizedKind
 
 
-@dataclass(frozen=True)
-class Title:
-    """Localized problem title."""
+@dataclass(frozen=True, slots=True)
+class LocalizedText:
+    """Localized text record (title, description, editorial, hint, ...).
 
-    problem_id: int
-    language: Language
-    title: str = ""
-
-
-@dataclass(frozen=True)
-class Description:
-    """Localized problem description."""
-
-    problem_id: int
-    language: Language
-    description: str = ""
-
-
-@dataclass(frozen=True)
-class Editorial:
-    """Localized problem editorial (solution explanation)."""
-
-    problem_id: int
-    language: Language
-    editorial: str = ""
-
-
-@dataclass(frozen=True)
-class Explanation:
-    """Localized example explanation."""
+    One record type for all localized content; ``kind`` tells what
+    the text is. ``entity_id`` is the example_id for EXPLANATION and
+    the problem_id for every other kind.
+    """
 
-    example_id: int
+    entity_id: int
     language: Language
-    explanation: str = ""
+    kind: LocalizedKind
+    text: str = ""
+    _hash: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        _set(self, "_hash", hash(
+            (self.entity_id, self.language, self.kind, self.text)
+        ))
 
-@dataclass(frozen=True)
-class Hint:
-    """Localized problem hint."""
+    def __hash__(self) -> int:
+        return self._hash
 
-    problem_id: int
-    language: Language
-    hint: str = ""
+    __reduce__ = _reduce_init_fields
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tag:
     """Problem tag (flexible labeling system).
 
     Unlike Category (enum), tags are free-form strings
     for organic growth and community tagging.
+    The tag string is interned: the same tag repeats across problems.
     """
 
     problem_id: int
     tag: str = ""
+
+    def __post_init__(self) -> None:
+        _set(self, "tag", sys.intern(self.tag))
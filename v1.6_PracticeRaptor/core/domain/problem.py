@@ -1,7 +1,11 @@
 """Problem-related domain models."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 
+from ._frozen import _reduce_init_fields, _set
 from .enums import (
     Category,
     Complexity,
@@ -11,20 +15,67 @@ from .enums import (
     ProblemStatus,
 )
 
+# One bit per interface and programming language (their values are
+# distinct strings, so one table covers both enums)
+_LANG_BIT: dict[Language | ProgrammingLanguage, int] = {
+    lang: 1 << i for i, lang in enumerate(chain(Language, ProgrammingLanguage))
+}
 
-@dataclass(frozen=True)
+
+def lang_mask(*langs: Language | ProgrammingLanguage) -> int:
+    """Bitmask with one bit set per given language."""
+    mask = 0
+    for lang in langs:
+        mask |= _LANG_BIT[lang]
+    return mask
+
+
+def has_lang(mask: int, lang: Language | ProgrammingLanguage) -> bool:
+    """Check whether the bit of lang is set in mask."""
+    return bool(mask & _LANG_BIT[lang])
+
+
+@dataclass(frozen=True, slots=True)
 class Problem:
     """Minimal problem entity for list display.
 
     Lightweight model loaded for all problems in list view.
-    Title is fetched separately from localization (Title entity).
+    Title is fetched separately from localization (LocalizedText, TITLE).
     """
 
     problem_id: int = 0
     status: ProblemStatus = ProblemStatus.NOT_STARTED
+    _hash: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        _set(self, "_hash", hash((self.problem_id, self.status)))
 
-@dataclass(frozen=True)
+    def __hash__(self) -> int:
+        return self._hash
+
+    __reduce__ = _reduce_init_fields
+
+
+def make_problem(
+    problem_id: int,
+    status: ProblemStatus | str = ProblemStatus.NOT_STARTED,
+) -> Problem:
+    """Return the shared Problem for (problem_id, status).
+
+    Problem is immutable, so list loads can reuse one instance per
+    pair instead of allocating a duplicate for every row. A raw status
+    value such as "solved" is converted to its ProblemStatus member.
+    """
+    return _make_problem(problem_id, ProblemStatus(status))
+
+
+@lru_cache(maxsize=8192)
+def _make_problem(problem_id: int, status: ProblemStatus) -> Problem:
+    # Always called positionally with a member, so one key per pair
+    return Problem(problem_id, status)
+
+
+@dataclass(frozen=True, slots=True)
 class ProblemSelector:
     """Problem metadata for filtering and selection.
 
@@ -38,22 +89,60 @@ class ProblemSelector:
     difficulty: Difficulty = Difficulty.EASY
     tags: tuple[str, ...] = ()
     categories: tuple[Category, ...] = ()
-
-
-@dataclass(frozen=True)
+    # lang_mask of both language tuples, built once in __post_init__
+    language_mask: int = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Tags repeat across problems; keep one shared string per tag
+        _set(self, "tags", tuple(map(sys.intern, self.tags)))
+        _set(self, "language_mask", lang_mask(
+            *self.supported_languages, *self.supported_programming_languages
+        ))
+        _set(self, "_hash", hash((
+            self.problem_id,
+            self.supported_languages,
+            self.supported_programming_languages,
+            self.difficulty,
+            self.tags,
+            self.categories,
+        )))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    __reduce__ = _reduce_init_fields
+
+    def supports(self, required_mask: int) -> bool:
+        """Check that every language in required_mask is supported."""
+        return self.language_mask & required_mask == required_mask
+
+
+@dataclass(frozen=True, slots=True)
 class Example:
     """Problem example with input/output.
 
-    Explanation is stored separately in Explanation entity (localized).
+    Explanation is stored separately as LocalizedText (EXPLANATION).
     """
 
     example_id: int
     problem_id: int
     input: str = ""
     output: str = ""
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _set(self, "_hash", hash(
+            (self.example_id, self.problem_id, self.input, self.output)
+        ))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    __reduce__ = _reduce_init_fields
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProblemDescription:
     """Complete problem description with all details.
 
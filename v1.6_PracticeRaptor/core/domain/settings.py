@@ -12,7 +12,7 @@ from .enums import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """User preferences and current session state.
 
@@ -30,7 +30,7 @@ class Settings:
     # Current session state (filters)
     select_problem_id: int | None = None
     select_difficulty: Difficulty | None = None
-    select_tags: tuple[str, ...] = ()
+    select_tags: frozenset[str] = frozenset()  # membership-tested per problem
     select_category: Category | None = None
     select_status: ProblemStatus | None = None
 
@@ -1,10 +1,13 @@
 """Solution-related domain models."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from .enums import Complexity, ProgrammingLanguage
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 
 @dataclass(frozen=True)
 class Signature:
@@ -120,5 +123,5 @@ class Draft:
     draft_id: int
     user_id: int
     solution: Solution
-    created_at: datetime
-    updated_at: datetime
+    created_at: "datetime"
+    updated_at: "datetime"
@@ -0,0 +1,57 @@
+"""Tests for cached hashes of key-like domain records."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+RECORDS = {
+    "Problem": "Problem(1, ProblemStatus.SOLVED)",
+    "ProblemSelector": (
+        "ProblemSelector(1, (Language.EN,), (ProgrammingLanguage.PYTHON,),"
+        " Difficulty.HARD, ('array',), (Category.ARRAY,))"
+    ),
+    "Example": "Example(1, 1, '[2, 7], 9', '[0, 1]')",
+    "LocalizedText": (
+        "LocalizedText(1, Language.EN, LocalizedKind.TITLE, 'Two Sum')"
+    ),
+}
+
+IMPORTS = "import pickle, sys; from core.domain import *; "
+
+
+def run_python(code: str, hash_seed: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with a fixed PYTHONHASHSEED."""
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestPickledHash:
+    """Tests that unpickled records hash like fresh ones."""
+
+    @pytest.mark.parametrize("name", RECORDS)
+    def test_round_trip_across_processes(self, name: str) -> None:
+        """A record pickled in one process is a valid key in another."""
+        expr = RECORDS[name]
+        dumped = run_python(IMPORTS + f"print(pickle.dumps({expr}).hex())", "1")
+        assert dumped.returncode == 0, dumped.stderr
+
+        check = (
+            IMPORTS
+            + f"loaded = pickle.loads(bytes.fromhex({dumped.stdout.strip()!r})); "
+            + f"fresh = {expr}; "
+            + "sys.exit(not (loaded == fresh and hash(loaded) == hash(fresh)"
+            + " and fresh in {loaded: 1}))"
+        )
+        loaded = run_python(check, "2")
+
+        assert loaded.returncode == 0, loaded.stderr
@@ -0,0 +1,54 @@
+"""Tests for the bulk localized text store."""
+from core.domain import (
+    Language,
+    LocalizationStore,
+    LocalizedKind,
+    LocalizedText,
+)
+
+TITLE = (1, Language.EN, LocalizedKind.TITLE)
+
+
+class TestLocalizationStore:
+    """Tests for LocalizationStore."""
+
+    def test_add_replaces_existing_key(self) -> None:
+        """Adding the same key again keeps only the latest text."""
+        store = LocalizationStore()
+        store.add(*TITLE, "Two Sum")
+        store.add(*TITLE, "Two Sum II")
+
+        assert store.get(*TITLE) == "Two Sum II"
+        assert len(store) == 1
+
+    def test_get_falls_back_to_default(self) -> None:
+        """A missing key returns the default, empty unless given."""
+        store = LocalizationStore()
+
+        assert store.get(*TITLE) == ""
+        assert store.get(*TITLE, default="Untitled") == "Untitled"
+
+    def test_record_builds_equal_localized_text(self) -> None:
+        """record() returns a LocalizedText equal to a fresh one."""
+        store = LocalizationStore()
+        store.add(*TITLE, "Two Sum")
+
+        assert store.record(*TITLE) == LocalizedText(*TITLE, "Two Sum")
+
+    def test_record_missing_returns_none(self) -> None:
+        """record() returns None for a missing key."""
+        store = LocalizationStore()
+        store.add(*TITLE, "Two Sum")
+
+        assert store.record(1, Language.RU, LocalizedKind.TITLE) is None
+
+    def test_len_counts_distinct_keys(self) -> None:
+        """len() counts one entry per (entity_id, language, kind)."""
+        store = LocalizationStore()
+        assert len(store) == 0
+
+        store.add(*TITLE, "Two Sum")
+        store.add(1, Language.RU, LocalizedKind.TITLE, "Сумма двух")
+        store.add(1, Language.EN, LocalizedKind.DESCRIPTION, "Given an array")
+
+        assert len(store) == 3
@@ -0,0 +1,77 @@
+"""Tests for problem domain models."""
+import copy
+import pickle
+
+from core.domain import (
+    Language,
+    ProblemSelector,
+    ProblemStatus,
+    ProgrammingLanguage,
+    has_lang,
+    lang_mask,
+    make_problem,
+)
+
+
+class TestMakeProblem:
+    """Tests for the shared Problem factory."""
+
+    def test_default_and_explicit_status_share_instance(self) -> None:
+        """Omitting the status and passing the default give one instance."""
+        assert make_problem(1) is make_problem(1, ProblemStatus.NOT_STARTED)
+        assert make_problem(1) is make_problem(1, status=ProblemStatus.NOT_STARTED)
+
+    def test_raw_status_is_normalized(self) -> None:
+        """A raw status string yields a Problem holding the enum member."""
+        from_str = make_problem(2, "solved")
+
+        assert from_str.status is ProblemStatus.SOLVED
+        assert make_problem(2, ProblemStatus.SOLVED) is from_str
+
+
+class TestLanguageMask:
+    """Tests for the language bitmask on ProblemSelector."""
+
+    SELECTOR = ProblemSelector(
+        1,
+        supported_languages=(Language.EN,),
+        supported_programming_languages=(ProgrammingLanguage.PYTHON,),
+    )
+
+    def test_mask_mixes_both_language_enums(self) -> None:
+        """Interface and programming languages get distinct bits."""
+        mask = lang_mask(Language.EN, ProgrammingLanguage.PYTHON)
+
+        assert self.SELECTOR.language_mask == mask
+        assert has_lang(mask, Language.EN)
+        assert has_lang(mask, ProgrammingLanguage.PYTHON)
+        assert not has_lang(mask, Language.RU)
+        assert not has_lang(mask, ProgrammingLanguage.JAVA)
+
+    def test_supports_subset(self) -> None:
+        """A mask of some supported languages is supported."""
+        assert self.SELECTOR.supports(lang_mask(ProgrammingLanguage.PYTHON))
+        assert self.SELECTOR.supports(lang_mask())
+
+    def test_supports_rejects_missing_language(self) -> None:
+        """A mask with any unsupported language is not supported."""
+        required = lang_mask(Language.EN, ProgrammingLanguage.JAVA)
+
+        assert not self.SELECTOR.supports(required)
+
+    def test_has_lang_on_empty_mask(self) -> None:
+        """No language is set in an empty mask."""
+        empty = lang_mask()
+
+        assert empty == 0
+        assert not has_lang(empty, Language.EN)
+        assert not has_lang(empty, ProgrammingLanguage.PYTHON)
+
+    def test_mask_survives_copy_and_pickle(self) -> None:
+        """Copied and unpickled selectors keep the same mask."""
+        copied = copy.copy(self.SELECTOR)
+        loaded = pickle.loads(pickle.dumps(self.SELECTOR))
+
+        assert copied.language_mask == self.SELECTOR.language_mask
+        assert loaded.language_mask == self.SELECTOR.language_mask
+        assert loaded == self.SELECTOR
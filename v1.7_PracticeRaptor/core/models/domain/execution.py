@@ -56,7 +56,7 @@ class Execution:
     def passed_count(self) -> int:
         """Count of passed tests."""
         return sum(
-            1 for r in self.test_results if r.result == ExecutionStatus.ACCEPTED
+            1 for r in self.test_results if r.result is ExecutionStatus.ACCEPTED
         )
 
     @property
@@ -67,7 +67,7 @@ class Execution:
     @property
     def is_accepted(self) -> bool:
         """Check if all tests passed."""
-        return self.result == ExecutionStatus.ACCEPTED
+        return self.result is ExecutionStatus.ACCEPTED
 
 
 @dataclass(frozen=True)
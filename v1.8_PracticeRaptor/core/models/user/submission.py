@@ -32,12 +32,12 @@ class TestResult:
     @property
     def passed(self) -> bool:
         """Check if test passed."""
-        return self.status == ExecutionStatus.ACCEPTED
+        return self.status is ExecutionStatus.ACCEPTED
 
     @property
     def failed(self) -> bool:
         """Check if test failed."""
-        return self.status != ExecutionStatus.ACCEPTED
+        return self.status is not ExecutionStatus.ACCEPTED
 
 
 @dataclass(frozen=True)
@@ -110,7 +110,7 @@ class Submission:
     @property
     def is_accepted(self) -> bool:
         """Check if submission was accepted (all tests passed)."""
-        return self.result == ExecutionStatus.ACCEPTED
+        return self.result is ExecutionStatus.ACCEPTED
 
     @property
     def passed_count(self) -> int: